@@ -0,0 +1,148 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  A list of RPN tokens (numbers, operators, VARIABLE NAMES) that
+//            is evaluated millions of times with different bindings.
+//    Output: An integer result per evaluation.
+//    Goal:   Parse and validate ONCE, then run many times without touching
+//            a single string.
+//
+// 2. BUDGET & BOUNDARIES
+//    Compile: O(n) once per distinct token list (then cached).
+//    Evaluate: O(n) with no int(token), no set literal, no string compares.
+//    Edge Cases:
+//       - Single number / single variable.
+//       - Stack underflow ("+" with one operand) -> rejected at compile time.
+//       - Leftover operands (["1", "2"]) -> rejected at compile time.
+//       - Truncate division toward zero, exactly like solve.py (int(l / r)).
+//
+// 3. STRATEGY & BOTTLENECK
+//    Naive:   Solution.evalRPN re-parses every token on every call.
+//    Pivot:   The token list never changes; only the bindings do.
+//    Tool:    A tiny compiler. Tokens are lowered to a compact instruction
+//             array (one opcode byte + one argument per instruction), and
+//             compiled programs live in a hash-keyed LRU cache.
+//
+// 4. THE STATE MACHINE (evaluate)
+//    - Pre-allocate the stack to the depth found at compile time and move a
+//      'top' pointer (same trick as Valid Parentheses solution3).
+//    - CONST / LOAD: write the constant / bound value at stack[top].
+//    - ADD / SUB / MUL / DIV: combine stack[top - 1] and stack[top].
+//    - Final Check: return stack[0]
+// ---------------------------------------------------------
+"""
+
+from array import array
+from functools import lru_cache
+from typing import List, Mapping, NamedTuple, Optional, Tuple
+
+# Opcodes
+CONST, LOAD, ADD, SUB, MUL, DIV = range(6)
+
+OPERATORS = {"+": ADD, "-": SUB, "*": MUL, "/": DIV}
+
+
+class Program(NamedTuple):
+    code: bytes # one opcode per instruction
+    args: array # constant index (CONST) or name index (LOAD), else 0
+    consts: Tuple[int, ...]
+    names: Tuple[str, ...]
+    max_depth: int
+
+
+def _parse_number(token: str) -> Optional[int]:
+    try:
+        return int(token)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _compile(tokens: Tuple[str, ...]) -> Program:
+    code = bytearray()
+    args = array('l')
+    consts: List[int] = []
+    names: List[str] = []
+    depth = max_depth = 0
+
+    for token in tokens:
+        if token in OPERATORS:
+            if depth < 2:
+                raise ValueError(f"stack underflow at operator {token!r}")
+            code.append(OPERATORS[token])
+            args.append(0)
+            depth -= 1
+            continue
+
+        number = _parse_number(token)
+        if number is not None:
+            code.append(CONST)
+            args.append(len(consts))
+            consts.append(number)
+        elif token.isidentifier():
+            if token not in names:
+                names.append(token)
+            code.append(LOAD)
+            args.append(names.index(token))
+        else:
+            raise ValueError(f"invalid token {token!r}")
+
+        depth += 1
+        max_depth = max(max_depth, depth)
+
+    if depth != 1:
+        raise ValueError(f"expression leaves {depth} values on the stack, expected 1")
+
+    return Program(bytes(code), args, tuple(consts), tuple(names), max_depth)
+
+
+def compile_rpn(tokens: List[str]) -> Program:
+    # The token tuple is the cache key, so the same expression compiles once
+    return _compile(tuple(tokens))
+
+
+def evaluate(program: Program, bindings: Optional[Mapping[str, int]] = None) -> int:
+    consts = program.consts
+    values = [bindings[name] for name in program.names] if program.names else ()
+    stack = [0] * program.max_depth
+    top = -1
+
+    for op, arg in zip(program.code, program.args):
+        if op == CONST:
+            top += 1
+            stack[top] = consts[arg]
+        elif op == LOAD:
+            top += 1
+            stack[top] = values[arg]
+        else:
+            r = stack[top]
+            top -= 1
+            l = stack[top]
+            if op == ADD:
+                stack[top] = l + r
+            elif op == SUB:
+                stack[top] = l - r
+            elif op == MUL:
+                stack[top] = l * r
+            else:
+                # Truncation toward zero, same as Solution.evalRPN
+                stack[top] = int(l / r)
+
+    return stack[0]
+
+
+def evalRPN(tokens: List[str], bindings: Optional[Mapping[str, int]] = None) -> int:
+    return evaluate(compile_rpn(tokens), bindings)
+
+
+if __name__ == "__main__":
+    # Test Case 1
+    print(f"Test 1 Output: {evalRPN(['2', '1', '+', '3', '*'])} (Expected: 9)")
+
+    # Test Case 2
+    tokens = ["10", "6", "9", "3", "+", "-11", "*", "/", "*", "17", "+", "5", "+"]
+    print(f"Test 2 Output: {evalRPN(tokens)} (Expected: 22)")
+
+    # Test Case 3: compile once, evaluate with many bindings
+    program = compile_rpn(["x", "y", "-", "3", "/"])
+    print(f"Test 3 Output: {[evaluate(program, {'x': x, 'y': 1}) for x in (-8, 1, 10)]} (Expected: [-3, 0, 3])")
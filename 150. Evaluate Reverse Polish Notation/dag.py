@@ -0,0 +1,266 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  A list of RPN tokens that repeats large subexpressions, followed
+//            by a stream of single-token edits ("token 17 is now 5").
+//    Output: The value of the expression after every edit.
+//    Goal:   Store and compute every distinct subtree ONCE, and pay only for
+//            the path from the edited token to the root on each edit.
+//
+// 2. BUDGET & BOUNDARIES
+//    Build: O(n) hash lookups, one node per DISTINCT subtree.
+//    Edit:  O(depth) hash lookups; stops early once a subtree comes out
+//           identical to the one it replaces.
+//    Space: O(live nodes) <= O(n), however long the stream of edits. Nodes
+//           are reference counted and freed as soon as nothing uses them.
+//    Edge Cases:
+//       - Malformed token lists -> ValueError, like compiled.py.
+//       - An edit that divides by zero raises and leaves the DAG untouched
+//         (the nodes it already built are freed again).
+//       - An edit may change a number or an operator, never one into the
+//         other (that would change the shape of the tree).
+//
+// 3. STRATEGY & BOTTLENECK
+//    Naive:   Re-run Solution.evalRPN after every edit: O(n) per edit.
+//    Pivot:   A subtree's value depends only on its structure.
+//    Tool:    Hash-consing. A node is keyed by (op, left id, right id), so
+//             equal subtrees get the same id and the value is memoized on the
+//             node. "+" and "*" sort their children, so "a b +" and "b a +"
+//             share a node too. Nodes are immutable, so an edit builds new
+//             nodes along its path instead of invalidating old ones, and
+//             the old ones are freed once their reference count hits zero.
+//
+// 4. THE STATE MACHINE
+//    - Token tree: parent / left / right token indices, and node[i] = DAG
+//      id of the subtree rooted at token i.
+//    - Edit token i: cons the new leaf (or operator), then walk parent[]
+//      to the root, re-consing each operator with its updated child.
+//    - Commit: point the tokens at the new nodes, then release the old ones.
+//    - refs[id] = parent nodes + tokens using it; at 0 the node leaves the
+//      table and its slot goes on a free list for reuse.
+//    - Final Check: values[node[root]]
+// ---------------------------------------------------------
+"""
+
+from array import array
+from typing import Dict, List, Tuple
+
+from compiled import ADD, CONST, MUL, OPERATORS, SUB, _parse_number
+
+
+class RPNDag:
+    def __init__(self, tokens: List[str]):
+        n = len(tokens)
+        self.tokens = list(tokens)
+
+        # DAG nodes (hash-consed): op, children and memoized value per id
+        self.ops = bytearray()
+        self.lefts = array('l')
+        self.rights = array('l')
+        self.values: List[int] = []
+        self.refs = array('l')
+        self.free: List[int] = [] # ids of freed nodes, reused by _new
+        self.table: Dict[Tuple[int, ...], int] = {}
+        self.hits = 0
+        self.misses = 0
+
+        # Token tree: which token consumes which, and each token's DAG node
+        self.parent = array('l', [-1]) * n
+        self.left = array('l', [-1]) * n
+        self.right = array('l', [-1]) * n
+        self.node = array('l', [0]) * n
+
+        stack: List[int] = []
+        for i, token in enumerate(tokens):
+            if token in OPERATORS:
+                if len(stack) < 2:
+                    raise ValueError(f"stack underflow at operator {token!r}")
+                r = stack.pop()
+                l = stack.pop()
+                self.left[i], self.right[i] = l, r
+                self.parent[l] = self.parent[r] = i
+                self.node[i] = self._cons(OPERATORS[token], self.node[l], self.node[r])
+            else:
+                self.node[i] = self._leaf(token)
+            self.refs[self.node[i]] += 1 # token i uses it
+            stack.append(i)
+
+        if len(stack) != 1:
+            raise ValueError(f"expression leaves {len(stack)} values on the stack, expected 1")
+        self.root = stack[0]
+
+    def _leaf(self, token: str) -> int:
+        number = _parse_number(token)
+        if number is None:
+            raise ValueError(f"invalid token {token!r}")
+        key = (CONST, number)
+        nid = self.table.get(key)
+        if nid is not None:
+            self.hits += 1
+            return nid
+        return self._new(key, CONST, -1, -1, number)
+
+    def _cons(self, op: int, a: int, b: int) -> int:
+        if (op == ADD or op == MUL) and a > b:
+            a, b = b, a # commutative: one node for both orders
+        key = (op, a, b)
+        nid = self.table.get(key)
+        if nid is not None:
+            self.hits += 1
+            return nid
+
+        l, r = self.values[a], self.values[b]
+        if op == ADD:
+            value = l + r
+        elif op == SUB:
+            value = l - r
+        elif op == MUL:
+            value = l * r
+        else:
+            # Truncation toward zero, same as Solution.evalRPN
+            value = int(l / r)
+        return self._new(key, op, a, b, value)
+
+    def _new(self, key: Tuple[int, ...], op: int, a: int, b: int, value: int) -> int:
+        # Called only once the value is known, so a failing cons adds nothing
+        self.misses += 1
+        if self.free:
+            nid = self.free.pop()
+            self.ops[nid], self.lefts[nid], self.rights[nid] = op, a, b
+            self.values[nid] = value
+            self.refs[nid] = 0
+        else:
+            nid = len(self.values)
+            self.ops.append(op)
+            self.lefts.append(a)
+            self.rights.append(b)
+            self.values.append(value)
+            self.refs.append(0)
+        if a >= 0:
+            self.refs[a] += 1
+            self.refs[b] += 1
+        self.table[key] = nid
+        return nid
+
+    def _release(self, nid: int) -> None:
+        # Drop one reference; free the node (and cascade) when none are left
+        pending = [nid]
+        while pending:
+            nid = pending.pop()
+            self.refs[nid] -= 1
+            if self.refs[nid] == 0:
+                self._free(nid, pending)
+
+    def _free(self, nid: int, pending: List[int]) -> None:
+        op, a, b = self.ops[nid], self.lefts[nid], self.rights[nid]
+        if op == CONST:
+            del self.table[(CONST, self.values[nid])]
+        else:
+            del self.table[(op, a, b)]
+            pending.append(a)
+            pending.append(b)
+        self.free.append(nid)
+
+    @property
+    def value(self) -> int:
+        return self.values[self.node[self.root]]
+
+    def set_token(self, i: int, token: str) -> int:
+        """Replace tokens[i] and return the new value of the expression."""
+        is_operator = self.left[i] >= 0
+        if (token in OPERATORS) != is_operator:
+            kind = "an operator" if is_operator else "an operand"
+            raise ValueError(f"token {i} is {kind}, cannot become {token!r}")
+
+        if is_operator:
+            nid = self._cons(OPERATORS[token], self.node[self.left[i]], self.node[self.right[i]])
+        else:
+            nid = self._leaf(token)
+
+        # Walk to the root, collecting the new ids; commit only if nothing raised
+        path = [(i, nid)]
+        child, j = i, self.parent[i]
+        try:
+            while j >= 0 and nid != self.node[child]:
+                a = nid if self.left[j] == child else self.node[self.left[j]]
+                b = nid if self.right[j] == child else self.node[self.right[j]]
+                nid = self._cons(OPERATORS[self.tokens[j]], a, b)
+                path.append((j, nid))
+                child, j = j, self.parent[j]
+        except ZeroDivisionError:
+            # Free what this edit built. Each path node holds the one below it,
+            # so releasing the top one cascades down through every new node.
+            top = path[-1][1]
+            if self.refs[top] == 0:
+                self.refs[top] = 1
+                self._release(top)
+            raise
+
+        # Commit: take the new references before dropping the old ones, so a
+        # node used by both versions is never freed in between
+        for j, nid in path:
+            self.refs[nid] += 1
+        for j, nid in path:
+            old, self.node[j] = self.node[j], nid
+            self._release(old)
+        self.tokens[i] = token
+        return self.value
+
+    def __len__(self) -> int:
+        return len(self.values) - len(self.free)
+
+
+def evalRPN(tokens: List[str]) -> int:
+    return RPNDag(tokens).value
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from solve import Solution
+
+    # Test Case 1
+    print(f"Test 1 Output: {evalRPN(['2', '1', '+', '3', '*'])} (Expected: 9)")
+
+    # Test Case 2: "4 13 5 / +" appears twice but is stored once
+    dag = RPNDag(["4", "13", "5", "/", "+", "4", "13", "5", "/", "+", "*"])
+    print(f"Test 2 Output: {dag.value}, {len(dag)} nodes (Expected: 36, 6 nodes)")
+
+    # Test Case 3: edit the first "5" (index 2), recompute only its path
+    print(f"Test 3 Output: {dag.set_token(2, '13')} (Expected: 30)")
+
+    # Benchmark: a balanced tree of 2^levels leaves drawn from a few values,
+    # so most subtrees repeat, then single-leaf edits.
+    random.seed(150)
+    levels = 16
+
+    def build(level: int) -> List[str]:
+        if level == 0:
+            return [str(random.randint(1, 3))]
+        return build(level - 1) + build(level - 1) + [random.choice("+-")]
+
+    tokens = build(levels)
+    leaves = [i for i, t in enumerate(tokens) if t not in OPERATORS]
+
+    start = time.perf_counter()
+    dag = RPNDag(tokens)
+    print(f"\n{len(tokens):,} tokens -> {len(dag):,} DAG nodes, built in {time.perf_counter() - start:.3f} s")
+
+    edits = [(random.choice(leaves), str(random.randint(1, 9))) for _ in range(200)]
+    solution = Solution()
+
+    start = time.perf_counter()
+    expected = []
+    for i, token in edits:
+        tokens[i] = token
+        expected.append(solution.evalRPN(tokens))
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = [dag.set_token(i, token) for i, token in edits]
+    incremental = time.perf_counter() - start
+
+    assert got == expected
+    print(f"Solution.evalRPN after each edit  {full:8.3f} s")
+    print(f"RPNDag.set_token                  {incremental:8.3f} s  ({full / incremental:,.0f}x)")
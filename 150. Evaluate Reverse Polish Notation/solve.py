@@ -1,4 +1,5 @@
 import math
+from typing import List
 
 class Solution:
     def evalRPN(self, tokens: List[str]) -> int:
@@ -0,0 +1,140 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  ONE RPN expression and a column (array) of values per variable.
+//    Output: One result per row, plus a per-row error code.
+//    Goal:   Evaluate the whole batch with one pass over the program, where
+//            every stack slot holds an entire column instead of one integer.
+//
+// 2. BUDGET & BOUNDARIES
+//    R rows, n tokens.
+//    Time: O(n) NumPy operations of length R (instead of n * R Python steps)
+//    Space: O(max_depth * R)
+//    Edge Cases:
+//       - Division by zero in SOME rows -> those rows get ZERO_DIVISION,
+//         the rest of the batch is still evaluated.
+//       - Negative operands: "/" must truncate toward zero like int(l / r),
+//         while NumPy's // floors toward negative infinity.
+//       - int64 overflow -> OVERFLOW for that row (Python ints never overflow,
+//         so silently wrapping would NOT match solve.py).
+//
+// 3. STRATEGY & BOTTLENECK
+//    Naive:   Call Solution.evalRPN once per row. O(n * R) interpreted work.
+//    Pivot:   Every row runs exactly the same instruction sequence, so the
+//             interpreter loop only has to run once.
+//    Tool:    compiled.compile_rpn for validation + instructions, NumPy int64
+//             columns as stack slots, and an error-code column.
+//
+// 4. THE STATE MACHINE
+//    - CONST: broadcast the constant to a full column.
+//    - LOAD:  push the variable's column.
+//    - ADD / SUB / MUL: combine the two top columns, flag overflowed rows.
+//    - DIV: floor divide, then add 1 where the remainder is non-zero and the
+//           signs differ (= truncation toward zero). Rows with |l| >= 2^53 are
+//           re-done with Python's int(l / r) so float rounding matches too.
+//    - Final Check: results = stack[0], with error rows zeroed.
+// ---------------------------------------------------------
+"""
+
+from typing import List, Mapping, NamedTuple, Optional
+
+import numpy as np
+
+from compiled import ADD, CONST, DIV, LOAD, MUL, SUB, Program, compile_rpn
+
+# Per-row error codes
+OK, ZERO_DIVISION, OVERFLOW = 0, 1, 2
+
+INT64_MIN = np.iinfo(np.int64).min
+# Below this magnitude int(l / r) and exact truncation always agree
+EXACT_FLOAT_LIMIT = 2**53
+
+
+class BatchResult(NamedTuple):
+    values: np.ndarray # int64 result per row (0 where errors != OK)
+    errors: np.ndarray # uint8 error code per row
+
+
+def _truncating_divide(l: np.ndarray, r: np.ndarray, errors: np.ndarray) -> np.ndarray:
+    zero = r == 0
+    errors[zero & (errors == OK)] = ZERO_DIVISION
+
+    # INT64_MIN / -1 does not fit in int64
+    overflow = (l == INT64_MIN) & (r == -1)
+    errors[overflow & (errors == OK)] = OVERFLOW
+
+    safe_r = np.where(zero | overflow, 1, r)
+    q, rem = np.divmod(l, safe_r)
+    q += (rem != 0) & ((l < 0) != (safe_r < 0))
+
+    # Huge numerators: mirror int(l / r) exactly, float rounding included
+    huge = np.flatnonzero((np.abs(l.astype(np.float64)) >= EXACT_FLOAT_LIMIT) & (errors == OK))
+    for row in huge:
+        q[row] = int(int(l[row]) / int(r[row]))
+    return q
+
+
+def _checked(op: int, l: np.ndarray, r: np.ndarray, errors: np.ndarray) -> np.ndarray:
+    with np.errstate(over="ignore"):
+        if op == ADD:
+            res = l + r
+            # Same-sign operands with a different-sign result wrapped around
+            overflow = ((l ^ res) & (r ^ res)) < 0
+        elif op == SUB:
+            res = l - r
+            overflow = ((l ^ r) & (l ^ res)) < 0
+        elif op == MUL:
+            res = l * r
+            safe_r = np.where(r == 0, 1, r)
+            overflow = (r != 0) & ((res // safe_r != l) | ((l == INT64_MIN) & (r == -1)))
+        else:
+            raise ValueError(f"unknown opcode {op}")
+    errors[overflow & (errors == OK)] = OVERFLOW
+    return res
+
+
+def evaluate_columns(program: Program, columns: Optional[Mapping[str, np.ndarray]] = None,
+                     rows: Optional[int] = None) -> BatchResult:
+    columns = columns or {}
+    bound = [np.asarray(columns[name], dtype=np.int64) for name in program.names]
+    if rows is None:
+        rows = len(bound[0]) if bound else 1
+
+    errors = np.zeros(rows, dtype=np.uint8)
+    stack: List[np.ndarray] = [None] * program.max_depth
+    top = -1
+
+    for op, arg in zip(program.code, program.args):
+        if op == CONST:
+            top += 1
+            stack[top] = np.full(rows, program.consts[arg], dtype=np.int64)
+        elif op == LOAD:
+            top += 1
+            stack[top] = bound[arg]
+        else:
+            r = stack[top]
+            top -= 1
+            l = stack[top]
+            if op == DIV:
+                stack[top] = _truncating_divide(l, r, errors)
+            else:
+                stack[top] = _checked(op, l, r, errors)
+
+    values = np.where(errors == OK, stack[0], 0)
+    return BatchResult(values, errors)
+
+
+def evalRPNColumns(tokens: List[str], columns: Optional[Mapping[str, np.ndarray]] = None,
+                   rows: Optional[int] = None) -> BatchResult:
+    return evaluate_columns(compile_rpn(tokens), columns, rows)
+
+
+if __name__ == "__main__":
+    x = np.array([6, -7, 7, 3, 10])
+    y = np.array([4, 2, -2, 0, -3])
+    result = evalRPNColumns(["x", "y", "/"], {"x": x, "y": y})
+    print(f"Test 1 Output: {result.values.tolist()} (Expected: [1, -3, -3, 0, -3])")
+    print(f"Test 1 Errors: {result.errors.tolist()} (Expected: [0, 0, 0, 1, 0])")
+
+    result = evalRPNColumns(["x", "x", "*"], {"x": np.array([3, 2**62])})
+    print(f"Test 2 Output: {result.values.tolist()} {result.errors.tolist()} (Expected: [9, 0] [0, 2])")
@@ -0,0 +1,139 @@
+from array import array
+from typing import Iterable
+
+
+class CompactMinStack:
+    """
+    Goal: the same O(1) MinStack, but for tens of millions of entries
+    """
+
+    __slots__ = ("stack", "mins", "min_idx")
+
+    def __init__(self):
+        """
+        Budget: MinStack keeps two lists of boxed ints, i.e. two 8-byte pointers
+        per element plus a 28+ byte int object behind each one.
+        Strategy:
+        - Naive: one min per element (sstack) even when the min never changes.
+        - Pivot: the min only changes at a few "record low" pushes. Store just
+          those change points: the min value and the index it was pushed at.
+        Tool: array('q') for raw 8-byte values, no boxing, no parallel min stack.
+        """
+        self.stack = array('q')
+        self.mins = array('q')     # min value at each change point
+        self.min_idx = array('q')  # stack index where that min was pushed
+
+    def push(self, val: int) -> None:
+        """
+        THE STATE MACHINE (The "Human" logic)
+        - ALWAYS: append val to stack
+        - IF [no min yet OR val < current min]: record a new change point
+        """
+        if not self.mins or val < self.mins[-1]:
+            self.mins.append(val)
+            self.min_idx.append(len(self.stack))
+        self.stack.append(val)
+
+    def push_many(self, vals: Iterable[int]) -> None:
+        # Convert first: a bad value raises here, before the stack is touched
+        batch = array('q', vals)
+        start = len(self.stack)
+        self.stack.extend(batch)
+
+        # Only the new record lows become change points
+        mins, min_idx = self.mins, self.min_idx
+        current = mins[-1] if mins else None
+        for i, val in enumerate(batch, start):
+            if current is None or val < current:
+                current = val
+                mins.append(val)
+                min_idx.append(i)
+
+    def pop(self) -> None:
+        self.stack.pop()
+        # The change point belonged to the element we just removed
+        if self.min_idx[-1] == len(self.stack):
+            self.mins.pop()
+            self.min_idx.pop()
+
+    def pop_many(self, k: int) -> None:
+        if k <= 0:
+            return
+        if k > len(self.stack):
+            raise IndexError("pop from empty stack")
+        new_len = len(self.stack) - k
+        del self.stack[new_len:]
+
+        min_idx = self.min_idx
+        cut = len(min_idx)
+        while cut and min_idx[cut - 1] >= new_len:
+            cut -= 1
+        del self.mins[cut:]
+        del min_idx[cut:]
+
+    def top(self) -> int:
+        return self.stack[-1]
+
+    def getMin(self) -> int:
+        return self.mins[-1]
+
+    def __len__(self) -> int:
+        return len(self.stack)
+
+
+# ---------------------------------------------------------
+# BENCHMARK: python compact.py [N]
+# Each implementation runs in a fresh process so the RSS numbers do not
+# contaminate each other.
+# ---------------------------------------------------------
+
+def _measure(name: str, n: int):
+    import random
+    import resource
+    import time
+
+    from solve import MinStack
+
+    random.seed(155)
+    vals = [random.randint(-2**31, 2**31 - 1) for _ in range(n)]
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    obj = MinStack() if name == "MinStack" else CompactMinStack()
+    start = time.perf_counter()
+    for v in vals:
+        obj.push(v)
+        obj.getMin()
+    push_secs = time.perf_counter() - start
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - base
+
+    start = time.perf_counter()
+    for _ in range(n):
+        obj.top()
+        obj.pop()
+    pop_secs = time.perf_counter() - start
+
+    bulk_secs = None
+    if name == "CompactMinStack":
+        obj = CompactMinStack()
+        start = time.perf_counter()
+        obj.push_many(vals)
+        obj.pop_many(n)
+        bulk_secs = time.perf_counter() - start
+
+    return rss, n / push_secs, n / pop_secs, bulk_secs
+
+
+if __name__ == "__main__":
+    import multiprocessing
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    print(f"N = {n:,}")
+    print(f"{'class':<16} {'RSS (MiB)':>10} {'push+getMin/s':>14} {'top+pop/s':>12} {'bulk push+pop':>14}")
+    for name in ("MinStack", "CompactMinStack"):
+        with multiprocessing.Pool(1) as pool:
+            rss, push_rate, pop_rate, bulk = pool.apply(_measure, (name, n))
+        bulk_txt = f"{bulk:.3f} s" if bulk is not None else "-"
+        # ru_maxrss is in KiB on Linux
+        print(f"{name:<16} {rss / 1024:>10.1f} {push_rate:>14,.0f} {pop_rate:>12,.0f} {bulk_txt:>14}")
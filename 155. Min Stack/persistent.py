@@ -0,0 +1,134 @@
+from typing import List, Optional
+
+
+class _Node:
+    """One immutable stack entry. `below` is shared by every version that has it."""
+
+    __slots__ = ("val", "min", "below", "size")
+
+    def __init__(self, val: int, below: "Optional[_Node]"):
+        self.val = val
+        self.min = val if below is None or val < below.min else below.min
+        self.below = below
+        self.size = 1 if below is None else below.size + 1
+
+
+class PersistentMinStack:
+    """
+    Goal: a MinStack whose every past state can be kept and restored in O(1)
+    """
+
+    __slots__ = ("head", "versions")
+
+    def __init__(self):
+        """
+        Budget: with MinStack, a checkpoint copies `stack` and `sstack`, O(N)
+        time and memory per snapshot.
+        Strategy:
+        - Naive: copy both lists on snapshot(), swap them back on restore().
+        - Pivot: a pushed entry never changes, and neither does the stack under
+          it. Make entries immutable linked nodes, each carrying the running
+          min, and a whole stack state is just a pointer to its top node.
+        Tool: Persistent (structure-sharing) linked list.
+
+        THE STATE MACHINE (The "Human" logic)
+        - push: head = Node(val, below=head), min = min(val, below.min)
+        - pop: head = head.below (the old node lives on in older versions)
+        - snapshot: remember head; restore: head = remembered pointer
+        """
+        self.head: Optional[_Node] = None
+        self.versions: List[Optional[_Node]] = []
+
+    def push(self, val: int) -> None:
+        self.head = _Node(val, self.head)
+
+    def pop(self) -> None:
+        if self.head is None:
+            raise IndexError("pop from empty stack")
+        self.head = self.head.below
+
+    def top(self) -> int:
+        return self.head.val
+
+    def getMin(self) -> int:
+        return self.head.min
+
+    def snapshot(self) -> int:
+        """Record the current state in O(1) and return its version number."""
+        self.versions.append(self.head)
+        return len(self.versions) - 1
+
+    def restore(self, version: int) -> None:
+        """Roll back (or forward) to a recorded version in O(1)."""
+        self.head = self.versions[version]
+
+    def __len__(self) -> int:
+        return 0 if self.head is None else self.head.size
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    import tracemalloc
+
+    from solve import MinStack
+
+    stack = PersistentMinStack()
+    for val in (5, 3, 7):
+        stack.push(val)
+    v1 = stack.snapshot()
+    stack.pop()
+    stack.pop()
+    stack.push(9)
+    print(f"Test 1 Output: {stack.top()}, {stack.getMin()} (Expected: 9, 5)")
+    stack.restore(v1)
+    print(f"Test 2 Output: {stack.top()}, {stack.getMin()}, {len(stack)} (Expected: 7, 3, 3)")
+
+    class CopyingMinStack(MinStack):
+        """Checkpointing the obvious way: copy both lists."""
+
+        def __init__(self):
+            super().__init__()
+            self.versions = []
+
+        def snapshot(self) -> int:
+            self.versions.append((self.stack[:], self.sstack[:]))
+            return len(self.versions) - 1
+
+        def restore(self, version: int) -> None:
+            stack, sstack = self.versions[version]
+            self.stack, self.sstack = stack[:], sstack[:]
+
+    # Transactions on a deep stack: snapshot, a few pushes / pops, and a
+    # rollback one time in four. Every snapshot is kept.
+    random.seed(155)
+    base, transactions = 10**4, 1000
+    script = [[random.random() < 0.25] + [random.choice((None, random.randint(-10**6, 10**6))) for _ in range(8)]
+              for _ in range(transactions)]
+
+    results = {}
+    for cls in (CopyingMinStack, PersistentMinStack):
+        tracemalloc.start()
+        start = time.perf_counter()
+        stack = cls()
+        for i in range(base):
+            stack.push(base - i)
+        trace = []
+        for rollback, *ops in script:
+            version = stack.snapshot()
+            for val in ops:
+                if val is None:
+                    stack.pop()
+                else:
+                    stack.push(val)
+            if rollback:
+                stack.restore(version)
+            trace.append((stack.top(), stack.getMin()))
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[cls.__name__] = trace
+        print(f"{cls.__name__:<20} {elapsed:8.3f} s  {peak / 2**20:10.1f} MiB  "
+              f"({transactions:,} snapshots of a {base:,}-deep stack)")
+
+    assert results["CopyingMinStack"] == results["PersistentMinStack"]
@@ -0,0 +1,167 @@
+import asyncio
+import threading
+from typing import Optional, Tuple
+
+from solve import MinStack
+
+
+class LockedMinStack(MinStack):
+    """
+    Goal: a MinStack that many threads can push to and pop from at once
+    """
+
+    def __init__(self, lock_free_reads: bool = False):
+        """
+        Budget: MinStack.push reads self.sstack[-1] and THEN appends to both
+        lists. Two threads interleaving there can store a min that ignores the
+        other thread's value, breaking the invariant sstack[i] == min(stack[:i+1]).
+        Strategy:
+        - Naive: trust the GIL. It only makes single bytecodes atomic, not the
+          read-then-append sequence.
+        - Pivot: every mutation runs under one lock. Readers can skip the lock
+          by reading a (top, min) snapshot tuple that writers replace in a
+          single attribute store.
+        Tool: threading.Lock + an immutable snapshot
+        """
+        super().__init__()
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Tuple[int, int]] = None
+        self.lock_free_reads = lock_free_reads
+
+    def _refresh(self) -> None:
+        # Called with the lock held
+        self._snapshot = (self.stack[-1], self.sstack[-1]) if self.stack else None
+
+    def push(self, val: int) -> None:
+        with self._lock:
+            super().push(val)
+            self._snapshot = (val, self.sstack[-1])
+
+    def pop(self) -> None:
+        with self._lock:
+            super().pop()
+            self._refresh()
+
+    def peek(self) -> Tuple[int, int]:
+        """
+        (top, min) from the same moment in time. Lock-free: a single read of
+        the snapshot attribute.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            raise IndexError("peek from empty stack")
+        return snapshot
+
+    def top(self) -> int:
+        if self.lock_free_reads:
+            return self.peek()[0]
+        with self._lock:
+            return super().top()
+
+    def getMin(self) -> int:
+        if self.lock_free_reads:
+            return self.peek()[1]
+        with self._lock:
+            return super().getMin()
+
+
+class AsyncMinStack(MinStack):
+    """
+    Goal: a MinStack for asyncio producers/consumers where pop() waits for data
+    """
+
+    def __init__(self):
+        """
+        Strategy: one event loop runs one coroutine at a time, so the plain
+        MinStack operations are already atomic between awaits. The only new
+        thing is waiting: an asyncio.Condition wakes consumers on push.
+        """
+        super().__init__()
+        self._cond = asyncio.Condition()
+
+    async def push(self, val: int) -> None:
+        async with self._cond:
+            super().push(val)
+            self._cond.notify()
+
+    async def pop(self) -> int:
+        """
+        THE STATE MACHINE
+        - WHILE [stack empty]: await a push
+        - Pop and return the top value
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: bool(self.stack))
+            val = self.stack[-1]
+            super().pop()
+            return val
+
+
+# ---------------------------------------------------------
+# STRESS TEST: python threadsafe.py
+# Hammers one LockedMinStack from 1..N threads, then checks that
+# sstack[i] == min(stack[:i+1]) still holds for every i.
+# ---------------------------------------------------------
+
+def _check_invariant(obj: MinStack) -> bool:
+    running = None
+    for val, recorded in zip(obj.stack, obj.sstack):
+        running = val if running is None else min(running, val)
+        if recorded != running:
+            return False
+    return len(obj.stack) == len(obj.sstack)
+
+
+def _stress(threads: int, ops_per_thread: int, lock_free_reads: bool) -> Tuple[float, bool]:
+    import random
+    import time
+
+    obj = LockedMinStack(lock_free_reads=lock_free_reads)
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        barrier.wait()
+        for _ in range(ops_per_thread):
+            if rng.random() < 0.6:
+                obj.push(rng.randint(-1000, 1000))
+            else:
+                try:
+                    obj.pop()
+                except IndexError:
+                    pass
+            try:
+                obj.getMin()
+            except IndexError:
+                pass
+
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    return threads * ops_per_thread / elapsed, _check_invariant(obj)
+
+
+async def _async_demo() -> None:
+    obj = AsyncMinStack()
+    consumer = asyncio.ensure_future(obj.pop())
+    await asyncio.sleep(0)
+    await obj.push(7)
+    print(f"Async pop waited and received: {await consumer} (Expected: 7)")
+
+
+if __name__ == "__main__":
+    ops = 50_000
+    print(f"{'threads':>7} {'reads':>10} {'ops/sec':>12} {'invariant':>10}")
+    for lock_free_reads in (False, True):
+        for threads in (1, 2, 4, 8, 16):
+            rate, ok = _stress(threads, ops, lock_free_reads)
+            mode = "snapshot" if lock_free_reads else "locked"
+            print(f"{threads:>7} {mode:>10} {rate:>12,.0f} {'OK' if ok else 'BROKEN':>10}")
+
+    asyncio.run(_async_demo())
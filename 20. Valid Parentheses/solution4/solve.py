@@ -0,0 +1,102 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  BYTES from a chunk iterator or a memory-mapped file (GBs).
+//    Output: None if every bracket matches, else the byte offset of the
+//            first error (len(input) if openers are still open at the end).
+//    Goal:   One pass, never holding the whole file as a str.
+//
+// 2. BUDGET & BOUNDARIES
+//    N = file size.
+//    Time: O(N) single pass | Space: O(chunk size + nesting depth)
+//    Edge Cases:
+//       - Error inside a later chunk -> offset is global, not chunk-relative.
+//       - Closer with nothing open (")").
+//       - Openers left at EOF ("((") -> offset == N.
+//       - Non-bracket bytes (JSON keys, values, whitespace) are skipped.
+//
+// 3. STRATEGY & BOTTLENECK
+//    Naive:   f.read().decode() and isValid_Stack. O(N) memory for the str,
+//             plus solution2's repeated str.replace passes would be O(N^2).
+//    Pivot:   The only state that must survive a chunk boundary is the stack
+//             of open brackets. One byte per opener is enough.
+//    Tool:    bytearray stack + bytes.translate to drop non-bracket bytes in C
+//             before the Python loop sees them. Offsets are only recovered
+//             (by rescanning ONE chunk) once an error is found.
+//
+// 4. THE STATE MACHINE
+//    - Opener: push its byte onto the bytearray.
+//    - Closer: if stack empty OR popped byte != its opener -> report offset.
+//    - End: stack not empty -> report N.
+// ---------------------------------------------------------
+"""
+
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Union
+
+OPENERS = b"([{"
+CLOSERS = b")]}"
+
+# MATCH[closer] = its opener, 0 for every other byte
+MATCH = bytearray(256)
+for opener, closer in zip(OPENERS, CLOSERS):
+    MATCH[closer] = opener
+
+# bytes.translate(None, NOISE) deletes everything that is not a bracket
+NOISE = bytes(b for b in range(256) if b not in OPENERS + CLOSERS)
+
+
+def _offset_of_bracket(chunk: bytes, nth: int) -> int:
+    # Position of the nth bracket byte inside the raw chunk (slow path, runs once)
+    seen = -1
+    for i, b in enumerate(chunk):
+        if b in OPENERS or b in CLOSERS:
+            seen += 1
+            if seen == nth:
+                return i
+    return len(chunk)
+
+
+def validate_chunks(chunks: Iterable[Union[bytes, str]]) -> Optional[int]:
+    stack = bytearray()
+    base = 0 # global offset of the current chunk
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+
+        brackets = chunk.translate(None, NOISE)
+        for nth, b in enumerate(brackets):
+            opener = MATCH[b]
+            if opener == 0:
+                stack.append(b)
+            elif not stack or stack.pop() != opener:
+                return base + _offset_of_bracket(chunk, nth)
+
+        base += len(chunk)
+
+    return base if stack else None
+
+
+def validate_file(path: str, chunk_size: int = 1 << 20) -> Optional[int]:
+    with open(path, "rb") as f:
+        # mmap refuses zero-length files, and an empty file is balanced
+        if f.seek(0, 2) == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunks = (mm[i : i + chunk_size] for i in range(0, len(mm), chunk_size))
+            return validate_chunks(chunks)
+
+
+def validate_files(paths: List[str], workers: Optional[int] = None) -> Dict[str, Optional[int]]:
+    # One file per task: each worker maps and scans its own file
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(zip(paths, pool.map(validate_file, paths)))
+
+
+def isValid_Stream(s: str) -> bool:
+    if len(s) % 2 != 0: return False # Parity Check
+    return validate_chunks((s,)) is None
@@ -1,9 +1,17 @@
-def characterReplacement(s: str, k: int) -> int:
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from lc.profiling import WindowCounters
+
+
+def characterReplacement(s: str, k: int, counters: "Optional[WindowCounters]" = None) -> int:
     # Mathematical State
     count = {} # Frequency Map: maps char -> frequency in current window
     max_freq = 0 # count_max from our formula
     l = 0 # Left pointer
     max_length = 0 # Our result (The Codomain)
+    start = time.perf_counter() if counters is not None else 0.0
 
     # Iterate through the Domain using the Right pointer
     for r in range(len(s)):
@@ -21,4 +29,11 @@ def characterReplacement(s: str, k: int) -> int:
         # 3. Update Global Maximum
         max_length = max(max_length, r - l + 1)
 
+    if counters is not None:
+        # Profiling: every r is an expansion, every step of l a contraction
+        counters.add_time("scan", time.perf_counter() - start)
+        counters.add("expansions", len(s))
+        counters.add("contractions", l)
+        counters.add("max_freq_raises", max_freq)
+
     return max_length
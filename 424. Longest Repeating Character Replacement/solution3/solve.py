@@ -0,0 +1,108 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Union
+
+
+def _encode(s: str) -> Sequence[int]:
+    # Fast path: one byte per character, so a 256-slot list can be the counter
+    try:
+        return s.encode("latin-1")
+    except UnicodeEncodeError:
+        return [ord(c) for c in s]
+
+
+def _longest(data: Sequence[int], k: int, count: Union[List[int], Dict[int, int]]) -> int:
+    # Mathematical State (same as solution1, minus the dict and the while loop)
+    max_freq = 0 # count_max: only ever grows
+    l = 0 # Left pointer
+
+    for r, b in enumerate(data):
+        # 1. Update State
+        c = count[b] + 1
+        count[b] = c
+        if c > max_freq:
+            max_freq = c
+
+        # 2. Check Invariant: the window never SHRINKS, it only slides.
+        # A longer answer needs a bigger max_freq, so a stale max_freq can only
+        # keep the window at its best size so far, never report a wrong one.
+        if (r - l + 1) - max_freq > k:
+            count[data[l]] -= 1
+            l += 1
+
+    # 3. The final window length is the maximum ever reached
+    return len(data) - l
+
+
+def characterReplacement(s: str, k: int) -> int:
+    data = _encode(s)
+    count = [0] * 256 if isinstance(data, bytes) else defaultdict(int)
+    return _longest(data, k, count)
+
+
+def characterReplacementMany(s: str, ks: Iterable[int]) -> List[int]:
+    """
+    Answers for many k against the same s. The encoding and the global
+    letter counts are computed once; any k >= n - (count of the most common
+    letter) is answered without a pass (replace everything else -> n).
+    """
+    ks = list(ks)
+    data = _encode(s)
+    n = len(data)
+    if n == 0:
+        return [0] * len(ks)
+
+    totals = [0] * 256 if isinstance(data, bytes) else defaultdict(int)
+    for b in data:
+        totals[b] += 1
+    saturate = n - max(totals if isinstance(totals, list) else totals.values())
+
+    answers: Dict[int, int] = {}
+    for k in sorted(set(ks)):
+        if k >= saturate:
+            answers[k] = n
+        else:
+            count = [0] * 256 if isinstance(data, bytes) else defaultdict(int)
+            answers[k] = _longest(data, k, count)
+    return [answers[k] for k in ks]
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import sys
+    import time
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+    import lc
+
+    solution1 = lc.get("424", "sliding_window")
+    solution2 = lc.get("424", "binary_search")
+
+    print(f"Test 1 Output: {characterReplacement('AABABBA', 1)} (Expected: 4)")
+    print(f"Test 2 Output: {characterReplacementMany('ABAB', [0, 1, 2])} (Expected: [1, 3, 4])")
+
+    sizes = [int(a) for a in sys.argv[1:]] or [10**5, 10**6, 10**7]
+    budget = 10.0 # seconds; slower solutions are skipped at larger N
+    skip = set()
+    random.seed(424)
+    for n in sizes:
+        s = "".join(random.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=n))
+        print(f"\nN = {n:,}")
+        results = {}
+        for name, fn in (("solution1 (dict)", solution1), ("solution2 (binary search)", solution2),
+                         ("solution3 (byte array)", characterReplacement)):
+            if name in skip:
+                print(f"  {name:<28} skipped (over {budget:.0f} s at a smaller N)")
+                continue
+            start = time.perf_counter()
+            results[name] = fn(s, 3)
+            elapsed = time.perf_counter() - start
+            print(f"  {name:<28} {elapsed:8.3f} s")
+            if elapsed > budget:
+                skip.add(name)
+        assert len(set(results.values())) == 1
+
+        ks = list(range(0, 50))
+        start = time.perf_counter()
+        characterReplacementMany(s, ks)
+        print(f"  {'solution3 batch, 50 ks':<28} {time.perf_counter() - start:8.3f} s")
@@ -0,0 +1,139 @@
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+class CharacterReplacementStream:
+    """
+    Feed text chunk by chunk; `best` is always the (start, end, dominant_char)
+    of the longest window seen so far, where s[start:end] becomes uniform
+    after at most k replacements.
+
+    A stream is either all `str` (any Unicode; offsets count characters and
+    dominant_char is a character) or all `bytes` (offsets count bytes and
+    dominant_char is a 1-byte `bytes`, so UTF-8 text is treated byte-wise).
+    """
+
+    # Mathematical State: solution1's count / max_freq / l, carried across feeds.
+    # The window only ever grows or slides, so the ring buffer holding its
+    # symbol ids never needs more than the best length so far (doubling on growth).
+
+    def __init__(self, k: int):
+        self.k = k
+        self.kind: Optional[type] = None # str or bytes, fixed by the first chunk
+        self.count = [0] * 256 # frequency of each symbol id in the current window
+        self.max_freq = 0 # count_max, never decreases
+        self.dominant = 0 # symbol id that last raised max_freq
+        self.l = 0 # global left pointer
+        self.r = 0 # global offset of the next symbol
+
+        # str streams: characters get dense ids in order of first appearance,
+        # and chunks are encoded with str.translate while there are <= 256.
+        self.ids: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self._table: Optional[Dict[int, str]] = {}
+
+        # Ring buffer with the window's ids: ring[(head + i) % cap] is s[l + i]
+        self.ring = array('l', [0]) * 16
+        self.head = 0
+
+        self.best: Optional[Tuple[int, int, Union[str, bytes]]] = None
+
+    def _grow(self) -> None:
+        # Unroll the ring into a buffer twice the size, window starting at 0
+        cap = len(self.ring)
+        size = self.r - self.l
+        window = self.ring[self.head:] + self.ring[: self.head]
+        self.ring = window[:size] + array('l', [0]) * cap
+        self.head = 0
+
+    def _encode(self, chunk: str) -> Union[bytes, List[int]]:
+        # Register characters never seen before (set difference runs in C)
+        new = set(chunk).difference(self.ids)
+        for char in sorted(new):
+            sid = len(self.symbols)
+            self.ids[char] = sid
+            self.symbols.append(char)
+            if sid >= len(self.count):
+                self.count.append(0)
+            if self._table is not None:
+                if sid < 256:
+                    self._table[ord(char)] = chr(sid)
+                else:
+                    self._table = None # past 256 symbols: one dict lookup per char
+
+        if self._table is not None:
+            return chunk.translate(self._table).encode("latin-1")
+        ids = self.ids
+        return [ids[char] for char in chunk]
+
+    def _symbol(self, sid: int) -> Union[str, bytes]:
+        return self.symbols[sid] if self.kind is str else bytes((sid,))
+
+    def feed(self, chunk: Union[str, bytes]) -> None:
+        kind = str if isinstance(chunk, str) else bytes
+        if self.kind is None:
+            self.kind = kind
+        elif kind is not self.kind:
+            raise TypeError(f"this stream takes {self.kind.__name__} chunks, got {kind.__name__}")
+        if kind is str:
+            chunk = self._encode(chunk)
+
+        count, k = self.count, self.k
+        max_freq, dominant, l, r = self.max_freq, self.dominant, self.l, self.r
+        ring, head = self.ring, self.head
+        best_len = self.best[1] - self.best[0] if self.best else 0
+
+        for b in chunk:
+            # 1. Update State: push b into the ring at slot for global index r
+            if r - l == len(ring):
+                self.l, self.r, self.head = l, r, head
+                self._grow()
+                ring, head = self.ring, self.head
+            ring[(head + r - l) % len(ring)] = b
+
+            c = count[b] + 1
+            count[b] = c
+            if c > max_freq:
+                max_freq = c
+                dominant = b
+
+            # 2. Check Invariant: slide (never shrink) when too many replacements
+            if (r - l + 1) - max_freq > k:
+                count[ring[head]] -= 1
+                head = (head + 1) % len(ring)
+                l += 1
+            elif r - l + 1 > best_len:
+                # 3. Update Global Maximum. The window only grows when max_freq
+                # just rose (or before the first slide), so `dominant` really
+                # is the majority symbol of this window.
+                best_len = r - l + 1
+                self.best = (l, r + 1, self._symbol(dominant))
+
+            r += 1
+
+        self.max_freq, self.dominant, self.l, self.r = max_freq, dominant, l, r
+        self.ring, self.head = ring, head
+
+    @property
+    def max_length(self) -> int:
+        return self.best[1] - self.best[0] if self.best else 0
+
+
+def characterReplacementWindow(chunks: Iterable[Union[str, bytes]], k: int) -> Optional[Tuple[int, int, Union[str, bytes]]]:
+    stream = CharacterReplacementStream(k)
+    for chunk in chunks:
+        stream.feed(chunk)
+    return stream.best
+
+
+def characterReplacement(s: str, k: int) -> int:
+    stream = CharacterReplacementStream(k)
+    stream.feed(s)
+    return stream.max_length
+
+
+if __name__ == "__main__":
+    print(f"Test 1 Output: {characterReplacementWindow(['AAB', 'ABBA'], 1)} (Expected: (0, 4, 'A'))")
+    print(f"Test 2 Output: {characterReplacementWindow(['AB', 'AB'], 2)} (Expected: (0, 4, 'A'))")
+    print(f"Test 3 Output: {characterReplacementWindow(['日本日', '日x'], 1)} (Expected: (0, 4, '日'))")
+    print(f"Test 4 Output: {characterReplacementWindow([b'ab', b'bb'], 1)} (Expected: (0, 4, b'b'))")
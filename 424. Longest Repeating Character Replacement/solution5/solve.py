@@ -0,0 +1,75 @@
+import os
+import sys
+import time
+from typing import Optional
+
+if __name__ == "__main__": # run as a script: make the repo root (and lc) importable
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from lc.alphabet import compact
+from lc.profiling import WindowCounters
+
+
+def characterReplacement(s: str, k: int, counters: Optional[WindowCounters] = None) -> int:
+    # Dense ids: a list counter sized to the symbols that occur, for any text
+    timed = counters is not None
+    start = time.perf_counter() if timed else 0.0
+    alphabet = compact(s)
+    data = alphabet.encode(s)
+    count = alphabet.counter()
+    encoded = time.perf_counter() if timed else 0.0
+
+    # Mathematical State (solution3's non-shrinking window)
+    max_freq = 0 # count_max: only ever grows
+    l = 0 # Left pointer
+
+    for r, c in enumerate(data):
+        # 1. Update State
+        f = count[c] + 1
+        count[c] = f
+        if f > max_freq:
+            max_freq = f
+
+        # 2. Check Invariant: slide, never shrink
+        if (r - l + 1) - max_freq > k:
+            count[data[l]] -= 1
+            l += 1
+
+    if timed:
+        # Each raise of max_freq is +1 and each slide moves l by one
+        counters.add_time("encode", encoded - start)
+        counters.add_time("scan", time.perf_counter() - encoded)
+        counters.add("symbols", alphabet.size)
+        counters.add("expansions", len(data))
+        counters.add("slides", l)
+        counters.add("max_freq_raises", max_freq)
+
+    # 3. The final window length is the maximum ever reached
+    return len(data) - l
+
+
+if __name__ == "__main__":
+    import random
+
+    import lc
+
+    print(f"Test 1 Output: {characterReplacement('AABABBA', 1)} (Expected: 4)")
+    print(f"Test 2 Output: {characterReplacement('ΑΒΑΒ', 2)} (Expected: 4)")
+    print(f"Test 3 Output: {characterReplacement('😀😀a😀b', 1)} (Expected: 4)")
+
+    counters = WindowCounters()
+    characterReplacement("AABABBA", 1, counters)
+    print(f"Test 4 Output: {counters.to_json()}")
+
+    random.seed(424)
+    n = 10**6
+    for label, letters in (("ASCII", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"),
+                           ("CJK", "".join(chr(0x4E00 + i) for i in range(5000)))):
+        s = "".join(random.choices(letters, k=n))
+        print(f"\n{label}, N = {n:,}")
+        for name, fn in (("solution1 (dict)", lc.get("424", "sliding_window")),
+                         ("solution3 (byte array)", lc.get("424", "byte_array")),
+                         ("solution5 (compact alphabet)", characterReplacement)):
+            start = time.perf_counter()
+            fn(s, 3)
+            print(f"  {name:<30} {time.perf_counter() - start:8.3f} s")
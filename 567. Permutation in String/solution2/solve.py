@@ -1,7 +1,16 @@
-def checkInclusion(s1: str, s2: str) -> bool:
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from lc.profiling import WindowCounters
+
+
+def checkInclusion(s1: str, s2: str, counters: "Optional[WindowCounters]" = None) -> bool:
     if len(s1) > len(s2):
         return False
 
+    start = time.perf_counter() if counters is not None else 0.0
     s1_counts = [0] * 26
     s2_counts = [0] * 26
     
@@ -20,7 +29,7 @@ def checkInclusion(s1: str, s2: str) -> bool:
     l = 0
     for r in range(len(s1), len(s2)):
         if matches == 26:
-            return True
+            break
         
         # 1. Update character entering from the RIGHT
         idx = ord(s2[r]) - ord('a')
@@ -39,5 +48,15 @@ def checkInclusion(s1: str, s2: str) -> bool:
             matches -= 1
             
         l += 1
-        
+
+    if counters is not None:
+        # Profiling: l counts the slides; the matches updates are replayed
+        from lc.profiling import slide_steps, zero_transitions
+        diff = Counter(s1)
+        diff.subtract(s2[: len(s1)])
+        counters.add_time("scan", time.perf_counter() - start)
+        counters.add("expansions", len(s1) + l)
+        counters.add("slides", l)
+        counters.add("matches_updates", zero_transitions(diff, slide_steps(s2, len(s1), len(s1), len(s1) + l)))
+
     return matches == 26
@@ -0,0 +1,130 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  String s1 and a STREAM of s2 (iterable of chunks, or a file).
+//    Output: Every offset i where s2[i : i + len(s1)] is a permutation of s1.
+//    Goal:   Same "matches == 26" window as solution2, but s2 never has to
+//            sit in memory as one string.
+//
+// 2. BUDGET & BOUNDARIES
+//    N = len(s2) can be many GB.
+//    Time: O(N) | Space: O(len(s1) + chunk size)
+//    Edge Cases:
+//       - A matching window that straddles two chunks.
+//       - Chunks shorter than s1 (even empty chunks).
+//       - len(s1) > len(s2) -> nothing is yielded.
+//       - Bytes outside a-z (newlines, uppercase, UTF-8 ...): no permutation
+//         of s1 can contain one, so the window restarts right after it.
+//
+// 3. STRATEGY & BOTTLENECK
+//    Naive:   "".join(chunks) then run solution2. O(N) memory.
+//    Pivot:   The window only ever needs the last len(s1) characters to know
+//             which one leaves next. Everything older can be forgotten.
+//    Tool:    26-slot counts + matches counter (solution2) and a ring buffer
+//             of size len(s1) that survives across chunk boundaries.
+//
+// 4. THE STATE MACHINE
+//    - For every incoming byte at global offset i:
+//        0. Not a letter (LETTER[byte] == RESET): clear the window, continue.
+//        1. Add it to s2_counts, update matches.
+//        2. If the window is full: remove ring[pos] (the char leaving).
+//        3. Store the new char in ring[pos].
+//        4. If the window is full and matches == 26: yield i - len(s1) + 1.
+// ---------------------------------------------------------
+"""
+
+import mmap
+from typing import Iterable, Iterator, Union
+
+# Byte -> letter index 0..25, or RESET for anything that is not a-z
+RESET = 26
+LETTER = bytes(b - 97 if 97 <= b <= 122 else RESET for b in range(256))
+
+
+def checkInclusionStream(s1: str, chunks: Iterable[Union[str, bytes]]) -> Iterator[int]:
+    n1 = len(s1)
+    if n1 == 0:
+        raise ValueError("s1 must be non-empty")
+
+    if not s1.isascii() or not s1.isalpha() or not s1.islower():
+        raise ValueError("s1 must consist of lowercase letters a-z")
+
+    s1_counts = [0] * 26
+    s2_counts = [0] * 26
+    for c in s1:
+        s1_counts[ord(c) - ord('a')] += 1
+
+    # An empty window matches only the letters absent from s1
+    empty_matches = sum(1 for i in range(26) if s1_counts[i] == 0)
+    matches = empty_matches
+
+    # Ring buffer of the letter indices currently inside the window
+    ring = bytearray(n1)
+    pos = 0 # ring slot that holds the char about to leave
+    offset = 0 # global offset of the next incoming char
+    filled = 0 # letters seen since the last reset (window full once >= n1)
+
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            # One byte per character; anything non-ASCII becomes "?" (a reset)
+            chunk = chunk.encode("ascii", "replace")
+
+        for byte in chunk:
+            idx = LETTER[byte]
+            if idx == RESET:
+                # 0. No permutation of s1 spans this byte: start over after it
+                if filled:
+                    s2_counts = [0] * 26
+                    matches = empty_matches
+                    pos = filled = 0
+                offset += 1
+                continue
+
+            # 1. Update character entering from the RIGHT
+            s2_counts[idx] += 1
+            if s2_counts[idx] == s1_counts[idx]:
+                matches += 1
+            elif s2_counts[idx] == s1_counts[idx] + 1:
+                matches -= 1
+
+            # 2. Update character leaving from the LEFT (only once the window is full)
+            if filled >= n1:
+                idx_out = ring[pos]
+                s2_counts[idx_out] -= 1
+                if s2_counts[idx_out] == s1_counts[idx_out]:
+                    matches += 1
+                elif s2_counts[idx_out] == s1_counts[idx_out] - 1:
+                    matches -= 1
+
+            ring[pos] = idx
+            pos += 1
+            if pos == n1:
+                pos = 0
+            offset += 1
+            filled += 1
+
+            if matches == 26 and filled >= n1:
+                yield offset - n1
+
+
+def checkInclusionFile(s1: str, path: str, chunk_size: int = 1 << 20) -> Iterator[int]:
+    """
+    Memory-maps the file at `path` and scans it `chunk_size` bytes at a time.
+    Offsets are byte offsets into the file.
+    """
+    with open(path, "rb") as f:
+        # mmap refuses zero-length files
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            chunks = (mm[i : i + chunk_size] for i in range(0, len(mm), chunk_size))
+            yield from checkInclusionStream(s1, chunks)
+
+
+def checkInclusion(s1: str, s2: str) -> bool:
+    # Drop-in replacement for solution1/solution2: stop at the first hit.
+    if not s1:
+        return True
+    if len(s1) > len(s2):
+        return False
+    return next(checkInclusionStream(s1, (s2,)), None) is not None
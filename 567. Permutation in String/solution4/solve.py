@@ -0,0 +1,160 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  One large string s2 and MANY patterns s1_1, s1_2, ..., s1_k.
+//    Output: For each pattern, does s2 contain a permutation of it?
+//    Goal:   Pay for s2 once, then answer every pattern with array operations.
+//
+// 2. BUDGET & BOUNDARIES
+//    N = len(s2) = 10^6, k = thousands of patterns.
+//    Time:  O(26 * N) build, then O(N) vectorized work per DISTINCT length
+//    Space: O(26 * N) for the prefix histograms
+//    Edge Cases:
+//       - Empty pattern -> True (the empty window always matches).
+//       - Pattern longer than s2 -> False.
+//       - Many patterns sharing one length (answered together).
+//
+// 3. STRATEGY & BOTTLENECK
+//    Naive:   Call solution1/solution2 once per pattern. O(k * N) Python
+//             steps, each one paying for an ord() call.
+//    Pivot:   A window's histogram is a difference of two prefix histograms:
+//                 count(s2[i : i + L]) = P[i + L] - P[i]
+//    Tool:    NumPy. Encode s2 once as uint8, build P as an (N + 1) x 26
+//             cumulative array, and give each letter a random 64-bit weight.
+//             The weighted sum of a histogram is a "fingerprint" that also
+//             comes out of a 1-D prefix sum, so every window of length L gets
+//             its fingerprint from one vector subtraction.
+//
+// 4. THE STATE MACHINE
+//    - Group the patterns by length L.
+//    - window_keys = K[L:] - K[:-L]     (one fingerprint per window)
+//    - Sort window_keys once; np.searchsorted finds every pattern's
+//      matching run of windows in O(log N).
+//    - Confirm each candidate exactly against P[i + L] - P[i].
+// ---------------------------------------------------------
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+
+def _check_letters(text: str, name: str) -> None:
+    # Anything outside a-z would wrap around in the uint8 subtraction below
+    if text and not (text.isascii() and text.isalpha() and text.islower()):
+        raise ValueError(f"{name} must consist of lowercase letters a-z")
+
+
+class PermutationIndex:
+    def __init__(self, s2: str, seed: int = 0x567):
+        _check_letters(s2, "s2")
+        # uint8 codes 0..25, built once with no per-character Python work
+        self.codes = np.frombuffer(s2.encode("ascii"), dtype=np.uint8) - ord('a')
+        self.n = len(self.codes)
+
+        # prefix[i][c] = number of letter c in s2[:i]
+        self.prefix = np.zeros((self.n + 1, 26), dtype=np.int32)
+        self.prefix[np.arange(1, self.n + 1), self.codes] = 1
+        np.cumsum(self.prefix, axis=0, out=self.prefix)
+
+        # Fingerprints: uint64 arithmetic wraps mod 2^64, which keeps the
+        # subtraction K[i + L] - K[i] exact.
+        rng = np.random.default_rng(seed)
+        self.weights = rng.integers(0, 2**64 - 1, size=26, dtype=np.uint64, endpoint=True)
+        self.key_prefix = np.zeros(self.n + 1, dtype=np.uint64)
+        np.cumsum(self.weights[self.codes], out=self.key_prefix[1:])
+
+    def _histogram(self, s1: str) -> np.ndarray:
+        codes = np.frombuffer(s1.encode("ascii"), dtype=np.uint8) - ord('a')
+        return np.bincount(codes, minlength=26).astype(np.int32)
+
+    def _answer_length(self, length: int, patterns: List[str]) -> List[bool]:
+        hists = np.stack([self._histogram(p) for p in patterns])
+        pattern_keys = hists.astype(np.uint64) @ self.weights
+
+        window_keys = self.key_prefix[length:] - self.key_prefix[:-length]
+        order = np.argsort(window_keys, kind="stable")
+        sorted_keys = window_keys[order]
+
+        # [lo, hi) is the run of windows whose fingerprint equals the pattern's
+        lo = np.searchsorted(sorted_keys, pattern_keys, side="left")
+        hi = np.searchsorted(sorted_keys, pattern_keys, side="right")
+        candidates = hi > lo
+
+        # Exact confirmation of the first window in each run, all patterns at once
+        starts = order[np.minimum(lo, len(order) - 1)]
+        windows = self.prefix[starts + length] - self.prefix[starts]
+        confirmed = candidates & (windows == hists).all(axis=1)
+
+        # A fingerprint collision is astronomically rare, but never trust it:
+        # re-check the whole run for candidates the first window did not confirm.
+        for j in np.flatnonzero(candidates & ~confirmed):
+            run = order[lo[j] : hi[j]]
+            windows = self.prefix[run + length] - self.prefix[run]
+            confirmed[j] = (windows == hists[j]).all(axis=1).any()
+
+        return confirmed.tolist()
+
+    def query_many(self, patterns: List[str]) -> List[bool]:
+        answers = [False] * len(patterns)
+
+        # Group by length: every pattern of length L shares one window sweep
+        by_length: Dict[int, List[int]] = {}
+        for j, p in enumerate(patterns):
+            _check_letters(p, "every pattern")
+            if len(p) == 0:
+                answers[j] = True
+            elif len(p) <= self.n:
+                by_length.setdefault(len(p), []).append(j)
+
+        for length, indices in by_length.items():
+            group = self._answer_length(length, [patterns[j] for j in indices])
+            for j, ok in zip(indices, group):
+                answers[j] = ok
+        return answers
+
+    def contains(self, s1: str) -> bool:
+        return self.query_many([s1])[0]
+
+
+def checkInclusionBatch(patterns: List[str], s2: str) -> List[bool]:
+    return PermutationIndex(s2).query_many(patterns)
+
+
+def checkInclusion(s1: str, s2: str) -> bool:
+    return PermutationIndex(s2).contains(s1)
+
+
+if __name__ == "__main__":
+    import importlib.util
+    import os
+    import random
+    import time
+
+    # The sibling directory name has a space in it, so load solution2 by path
+    here = os.path.dirname(os.path.abspath(__file__))
+    spec = importlib.util.spec_from_file_location(
+        "solution2", os.path.join(here, "..", "solution2", "solve.py"))
+    solution2 = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(solution2)
+
+    random.seed(567)
+    s2 = "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=10**6))
+    patterns = ["".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=random.randint(2, 8)))
+                for _ in range(2000)]
+    # Plant a few real hits
+    patterns[:50] = [s2[i : i + 5][::-1] for i in range(0, 50000, 1000)]
+
+    sample = patterns[-20:]
+    start = time.perf_counter()
+    expected = [solution2.checkInclusion(p, s2) for p in sample]
+    loop_per_pattern = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    got = checkInclusionBatch(patterns, s2)
+    batch_per_pattern = (time.perf_counter() - start) / len(patterns)
+
+    assert got[-len(sample):] == expected
+    print(f"solution2 loop: {loop_per_pattern * 1e3:8.3f} ms / pattern")
+    print(f"batch index   : {batch_per_pattern * 1e3:8.3f} ms / pattern "
+          f"({loop_per_pattern / batch_per_pattern:.0f}x)")
@@ -0,0 +1,98 @@
+import os
+import sys
+import time
+from collections import Counter
+from typing import Optional
+
+if __name__ == "__main__": # run as a script: make the repo root (and lc) importable
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from lc.alphabet import compact
+from lc.profiling import WindowCounters, slide_steps, zero_transitions
+
+
+def checkInclusion(s1: str, s2: str, counters: Optional[WindowCounters] = None) -> bool:
+    if len(s1) > len(s2):
+        return False
+    if not s1:
+        return True
+
+    # Dense ids over the symbols that actually occur, instead of ord(c) - ord('a')
+    timed = counters is not None
+    start = time.perf_counter() if timed else 0.0
+    alphabet = compact(s1, s2)
+    a, b = alphabet.encode(s1), alphabet.encode(s2)
+    encoded = time.perf_counter() if timed else 0.0
+
+    # Mathematical State: diff[c] = count in s1 - count in the window.
+    # `mismatches` counts the symbols with diff != 0, so it starts at the number
+    # of distinct symbols in s1 and never needs an O(alphabet) scan; the same
+    # code works whether diff is a list or a dict.
+    diff = alphabet.counter()
+    for c in a:
+        diff[c] += 1
+    mismatches = len(set(a))
+
+    n = len(a)
+    found = False
+    r = -1
+    for r, c in enumerate(b):
+        # 1. Update symbol entering from the RIGHT
+        before = diff[c]
+        diff[c] = before - 1
+        if before == 0:
+            mismatches += 1
+        elif before == 1:
+            mismatches -= 1
+
+        # 2. Update symbol leaving from the LEFT
+        if r >= n:
+            c = b[r - n]
+            before = diff[c]
+            diff[c] = before + 1
+            if before == 0:
+                mismatches += 1
+            elif before == -1:
+                mismatches -= 1
+
+        # 3. Check Invariant: every count agrees
+        if mismatches == 0:
+            found = True
+            break
+
+    if timed:
+        counters.add_time("encode", encoded - start)
+        counters.add_time("scan", time.perf_counter() - encoded)
+        counters.add("symbols", alphabet.size)
+        counters.add("expansions", r + 1)
+        counters.add("slides", max(r + 1 - n, 0))
+        # Replayed here rather than counted in the loop above
+        counters.add("mismatch_updates", zero_transitions(Counter(a), slide_steps(b, n, 0, r + 1)))
+
+    return found
+
+
+if __name__ == "__main__":
+    import random
+
+    import lc
+
+    solution2 = lc.get("567", "matches")
+
+    print(f"Test 1 Output: {checkInclusion('ab', 'eidbaooo')} (Expected: True)")
+    print(f"Test 2 Output: {checkInclusion('ab', 'eidboaoo')} (Expected: False)")
+    print(f"Test 3 Output: {checkInclusion('Ab', 'xbAy')} (Expected: True)")
+    print(f"Test 4 Output: {checkInclusion('日本', 'は本日です')} (Expected: True)")
+
+    counters = WindowCounters()
+    checkInclusion("abc", "xxcxbxaxxbcaxx", counters)
+    print(f"Test 5 Output: {counters.ops} (Expected: expansions 12, slides 9)")
+
+    random.seed(567)
+    n = 10**6
+    s2 = "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=n))
+    s1 = "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=50))
+    for name, fn in (("solution2 (26-slot lists)", solution2), ("solution5 (compact alphabet)", checkInclusion)):
+        start = time.perf_counter()
+        fn(s1, s2)
+        print(f"{name:<30} {time.perf_counter() - start:8.3f} s  (N = {n:,})")
@@ -0,0 +1,112 @@
+import os
+import random
+import sys
+from collections import Counter
+from typing import Dict, List, Tuple
+
+if __name__ == "__main__": # run as a script: make the repo root (and lc) importable
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from lc.alphabet import compact
+
+# Random weights below 2^61: w[c] = base^(c + 1) mod (2^61 - 1)
+MOD = (1 << 61) - 1
+
+
+def checkInclusionMany(patterns: List[str], s2: str, seed: int = 0x567) -> List[bool]:
+    answers = [len(p) == 0 for p in patterns]
+    alphabet = compact(s2, *patterns)
+    data = alphabet.encode(s2)
+    n = len(data)
+
+    # Hash of a histogram: sum(count[c] * w[c]). It is linear in the counts,
+    # so one symbol entering or leaving a window changes it by one weight.
+    base = random.Random(seed).randrange(2, MOD - 1)
+    weight = [pow(base, c + 1, MOD) for c in range(alphabet.size)]
+
+    # Group patterns by length, then by hash, then by exact histogram
+    # (anagrams share a group and are confirmed together).
+    tables: Dict[int, Dict[int, List[Tuple[Counter, List[int]]]]] = {}
+    for i, p in enumerate(patterns):
+        if not p or len(p) > n:
+            continue
+        codes = alphabet.encode(p)
+        histogram = Counter(codes)
+        h = sum(weight[c] for c in codes)
+        groups = tables.setdefault(len(p), {}).setdefault(h, [])
+        for hist, members in groups:
+            if hist == histogram:
+                members.append(i)
+                break
+        else:
+            groups.append((histogram, [i]))
+
+    # One sliding window per DISTINCT length, shared by all its patterns
+    for length, table in tables.items():
+        h = sum(weight[c] for c in data[:length])
+        r = length
+        while True:
+            # 1. Check: O(1) lookup; confirm exactly on a hit, then retire the group
+            if h in table:
+                window = Counter(data[r - length : r])
+                groups = table[h]
+                for g in range(len(groups) - 1, -1, -1):
+                    hist, members = groups[g]
+                    if hist == window:
+                        for i in members:
+                            answers[i] = True
+                        del groups[g]
+                if not groups:
+                    del table[h]
+                    if not table:
+                        break # every pattern of this length is answered
+
+            if r == n:
+                break
+
+            # 2. Slide: one symbol enters on the right, one leaves on the left
+            h += weight[data[r]] - weight[data[r - length]]
+            r += 1
+
+    return answers
+
+
+def checkInclusion(s1: str, s2: str) -> bool:
+    return checkInclusionMany([s1], s2)[0]
+
+
+if __name__ == "__main__":
+    import time
+
+    import lc
+
+    print(f"Test 1 Output: {checkInclusion('ab', 'eidbaooo')} (Expected: True)")
+    print(f"Test 2 Output: {checkInclusion('ab', 'eidboaoo')} (Expected: False)")
+    print(f"Test 3 Output: {checkInclusionMany(['ab', 'ba', 'ooo', 'dbz', ''], 'eidbaooo')} "
+          f"(Expected: [True, True, True, False, True])")
+
+    solution2 = lc.get("567", "matches")
+    solution4 = lc.get("567", "batch")
+
+    random.seed(567)
+    s2 = "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=10**6))
+    patterns = ["".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=random.randint(2, 8)))
+                for _ in range(2000)]
+    patterns[:50] = [s2[i : i + 5][::-1] for i in range(0, 50000, 1000)]
+
+    sample = patterns[-20:]
+    start = time.perf_counter()
+    expected = [solution2(p, s2) for p in sample]
+    loop_per_pattern = (time.perf_counter() - start) / len(sample)
+
+    timings = {}
+    for name, fn in (("solution4 (NumPy index)", solution4), ("solution6 (shared windows)", checkInclusionMany)):
+        start = time.perf_counter()
+        got = fn(patterns, s2)
+        timings[name] = (time.perf_counter() - start) / len(patterns)
+        assert got[-len(sample):] == expected and all(got[:50])
+
+    print(f"\n{len(patterns):,} patterns, 7 distinct lengths, N = {len(s2):,}")
+    print(f"  {'solution2 (one pass each)':<28} {loop_per_pattern * 1e3:8.3f} ms / pattern")
+    for name, per_pattern in timings.items():
+        print(f"  {name:<28} {per_pattern * 1e3:8.3f} ms / pattern ({loop_per_pattern / per_pattern:.0f}x)")
@@ -0,0 +1,221 @@
+# ---------------------------------------------------------
+# 1. TRANSLATION & CONSTRAINTS
+#    Input:  An array of values (temperatures), built into an engine ONCE.
+#    Output: a) For every index: the nearest NEXT / PREVIOUS element that is
+#               GREATER / SMALLER (strictly or not), as index, distance or value.
+#            b) Threshold queries: the first j > i (or last j < i) with
+#               values[j] > x (or < x), for ANY x, not just x = values[i].
+#    Goal:   dailyTemperatures is (a) with next / greater / strict / distance.
+#
+# 2. BUDGET & BOUNDARIES
+#    N = 10^6, Q = 10^5 threshold queries.
+#    (a) O(N) per (direction, compare, strict) combination, cached.
+#    (b) O(N) build per compare, then O(log N) per query.
+#    Edge Cases:
+#       - No such element: index -1, distance 0 (like dailyTemperatures), value None.
+#       - i outside [0, N): nothing after / before it, so the miss result.
+#
+# 3. STRATEGY & BOTTLENECK
+#    Naive:   Rescan from i + 1 for every threshold query. O(N) per query.
+#    Pivot:   "first j >= l with values[j] > x" only needs to know whether a
+#             whole BLOCK has a maximum above x.
+#    Tool:    A max segment tree with descent. Climb from leaf l until the
+#             next block to the right has max > x, then descend into it,
+#             always preferring the left child. "smaller" reuses the same
+#             code on negated values (v < x  <=>  -v > -x).
+#
+# 4. THE STATE MACHINE (links)
+#    - Same monotonic stack as Solution.dailyTemperatures, walked forwards
+#      (next) or backwards (previous), with "<" or "<=" as the pop test
+#      depending on strict.
+# ---------------------------------------------------------
+
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DIRECTIONS = ("next", "previous")
+COMPARES = ("greater", "smaller")
+OUTPUTS = ("index", "distance", "value")
+
+
+def _int_array(values) -> Sequence[int]:
+    # int64 storage when the values fit, plain list otherwise (floats, big ints)
+    try:
+        return array('q', values)
+    except (OverflowError, TypeError):
+        return list(values)
+
+
+class MonotonicEngine:
+    def __init__(self, values: Sequence[int]):
+        self.values = _int_array(values)
+        self.n = len(self.values)
+        self._links: Dict[Tuple[str, str, bool], Sequence[int]] = {}
+        self._trees: Dict[str, Tuple[Sequence[int], int]] = {}
+        self._negated: Optional[Sequence[int]] = None # keys for "smaller"
+
+    # ---------- (a) nearest greater / smaller ----------
+
+    def links(self, direction: str = "next", compare: str = "greater", strict: bool = True) -> Sequence[int]:
+        """Index of the nearest qualifying element for every i, or -1."""
+        if direction not in DIRECTIONS or compare not in COMPARES:
+            raise ValueError(f"unknown direction/compare {direction!r}/{compare!r}")
+        key = (direction, compare, strict)
+        if key not in self._links:
+            self._links[key] = self._build_links(direction, compare, strict)
+        return self._links[key]
+
+    def _build_links(self, direction: str, compare: str, strict: bool) -> Sequence[int]:
+        keys = self._keys(compare)
+        n = self.n
+        link = array('q', [-1]) * n
+        stack: List[int] = [] # indices still waiting, keys non-increasing
+
+        order = range(n) if direction == "next" else range(n - 1, -1, -1)
+        for curr_idx in order:
+            curr = keys[curr_idx]
+            if strict:
+                while stack and keys[stack[-1]] < curr:
+                    link[stack.pop()] = curr_idx
+            else:
+                while stack and keys[stack[-1]] <= curr:
+                    link[stack.pop()] = curr_idx
+            stack.append(curr_idx)
+        return link
+
+    def nearest(self, direction: str = "next", compare: str = "greater", output: str = "index",
+                strict: bool = True) -> List[Optional[int]]:
+        if output not in OUTPUTS:
+            raise ValueError(f"unknown output {output!r}")
+        link = self.links(direction, compare, strict)
+        if output == "index":
+            return link.tolist()
+        if output == "distance":
+            return [abs(j - i) if j >= 0 else 0 for i, j in enumerate(link)]
+        values = self.values
+        return [values[j] if j >= 0 else None for j in link]
+
+    # ---------- (b) threshold queries ----------
+
+    def _keys(self, compare: str) -> Sequence[int]:
+        if compare == "greater":
+            return self.values
+        if self._negated is None:
+            self._negated = _int_array([-v for v in self.values])
+        return self._negated
+
+    def _tree(self, compare: str) -> Tuple[Sequence[int], int]:
+        if compare not in COMPARES:
+            raise ValueError(f"unknown compare {compare!r}")
+        if compare not in self._trees:
+            keys = self._keys(compare)
+            size = 1
+            while size < max(self.n, 1):
+                size *= 2
+            # Leaves at [size, size + n), padded with the minimum: a padded
+            # leaf can only be found after every real index, and is rejected.
+            pad = min(keys) if self.n else 0
+            tree = _int_array([pad] * size + list(keys) + [pad] * (size - self.n))
+            for p in range(size - 1, 0, -1):
+                l, r = tree[2 * p], tree[2 * p + 1]
+                tree[p] = l if l > r else r
+            self._trees[compare] = (tree, size)
+        return self._trees[compare]
+
+    def first_after(self, i: int, x: int, compare: str = "greater") -> int:
+        """First j > i with values[j] > x ("greater") or < x ("smaller"), else -1."""
+        tree, size = self._tree(compare)
+        if compare == "smaller":
+            x = -x
+        l = max(i + 1, 0)
+        if l >= self.n:
+            return -1
+
+        # Climb: move right block by block until one holds a key > x
+        p = l + size
+        while tree[p] <= x:
+            while p & 1: # right child: its parent's right neighbour comes next
+                p >>= 1
+            if p == 0:
+                return -1
+            p += 1
+
+        # Descend: the leftmost leaf in this block with key > x
+        while p < size:
+            p *= 2
+            if tree[p] <= x:
+                p += 1
+        j = p - size
+        return j if j < self.n else -1
+
+    def last_before(self, i: int, x: int, compare: str = "greater") -> int:
+        """Last j < i with values[j] > x ("greater") or < x ("smaller"), else -1."""
+        tree, size = self._tree(compare)
+        if compare == "smaller":
+            x = -x
+        r = min(i - 1, self.n - 1)
+        if r < 0:
+            return -1
+
+        # Mirror image of first_after: climb left, descend preferring the right
+        p = r + size
+        while tree[p] <= x:
+            while p > 1 and not p & 1:
+                p >>= 1
+            if p == 1:
+                return -1
+            p -= 1
+
+        while p < size:
+            p = 2 * p + 1
+            if tree[p] <= x:
+                p -= 1
+        return p - size
+
+
+def dailyTemperatures(temperatures: List[int]) -> List[int]:
+    return MonotonicEngine(temperatures).nearest("next", "greater", "distance")
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    # Test Case 1: same answers as Solution.dailyTemperatures
+    print(f"Test 1 Output: {dailyTemperatures([73, 74, 75, 71, 69, 72, 76, 73])} (Expected: [1, 1, 4, 2, 1, 1, 0, 0])")
+
+    engine = MonotonicEngine([73, 74, 75, 71, 69, 72, 76, 73])
+    # Test Case 2: previous smaller value
+    print(f"Test 2 Output: {engine.nearest('previous', 'smaller', 'value')} "
+          f"(Expected: [None, 73, 74, None, None, 69, 72, 72])")
+    # Test Case 3: first day warmer than 74 after day 3, last day colder than 72 before day 6
+    print(f"Test 3 Output: {engine.first_after(3, 74)}, {engine.last_before(6, 72, 'smaller')} (Expected: 6, 4)")
+
+    random.seed(739)
+    n, q = 10**6, 1000
+    temps = [random.randint(30, 100) for _ in range(n)]
+    queries = [(random.randrange(n), random.randint(95, 101)) for _ in range(q)]
+
+    def rescan(i: int, x: int) -> int:
+        for j in range(i + 1, n):
+            if temps[j] > x:
+                return j
+        return -1
+
+    start = time.perf_counter()
+    engine = MonotonicEngine(temps)
+    engine.first_after(0, 0)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = [engine.first_after(i, x) for i, x in queries]
+    tree_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = [rescan(i, x) for i, x in queries]
+    scan_time = time.perf_counter() - start
+
+    assert got == expected
+    print(f"\nN = {n:,}, {q:,} threshold queries (x near the maximum, so rescans run long)")
+    print(f"  rescan from i + 1          {scan_time:8.3f} s")
+    print(f"  segment tree descent       {tree_time:8.3f} s  (+ {build:.3f} s build)")
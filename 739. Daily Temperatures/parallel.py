@@ -0,0 +1,148 @@
+# ---------------------------------------------------------
+# 1. TRANSLATION & CONSTRAINTS
+#    Input:  A huge historical List[int] of temperatures (10^7 - 10^8).
+#    Output: The exact same answer array as Solution.dailyTemperatures.
+#    Goal:   Spread the monotonic-stack work over several processes.
+#
+# 2. BUDGET & BOUNDARIES
+#    N = 10^8, P = worker processes.
+#    Time: O(N / P) per worker + O(R + W) serial merge, where R is the number
+#          of chunk "records" and W the number of boundary-pending indices.
+#    Space: 2 * 8 * N bytes of shared memory (input + answers).
+#    Edge Cases:
+#       - Warmer day found in the SAME chunk -> solved by the worker.
+#       - Warmer day found in a LATER chunk -> solved by the merge pass.
+#       - Decreasing input -> everything stays pending, answers stay 0.
+#
+# 3. STRATEGY & BOTTLENECK
+#    Naive:   One Python loop over 10^8 items. The GIL pins it to one core.
+#    Pivot:   A chunk can answer its own days without looking at any other
+#             chunk. Only the days still on its stack at the end are open,
+#             and those can only be closed by a LATER chunk.
+#    Tool:    Process pool + multiprocessing.shared_memory, so workers read the
+#             input and write answers in place without pickling 10^8 ints.
+#
+# 4. THE STATE MACHINE
+#    - Worker(chunk):
+#        1. Run the usual monotonic stack on the chunk, write answers in place.
+#        2. Return the indices left on the stack (pending).
+#        3. Return the chunk's strict prefix maxima (records). Only a record
+#           can be the FIRST warmer day for something before the chunk:
+#           any non-record has an earlier, at-least-as-warm day in the chunk
+#           that would have popped it first.
+#    - Merge(left to right, carrying one stack of still-open indices):
+#        1. For each record of chunk j: pop every carried index colder than it.
+#        2. Push chunk j's pending indices onto the carried stack.
+#      Leftovers at the end keep answer 0.
+# ---------------------------------------------------------
+
+import os
+from array import array
+from multiprocessing import Pool, shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+
+def _solve_chunk(args: Tuple[str, str, int, int]) -> Tuple[List[int], List[int]]:
+    in_name, out_name, lo, hi = args
+    shm_in = shared_memory.SharedMemory(name=in_name)
+    shm_out = shared_memory.SharedMemory(name=out_name)
+    try:
+        temperatures = shm_in.buf.cast('q')[lo:hi].tolist()
+        answer = [0] * (hi - lo)
+        stack = []
+        records = []
+        warmest = None
+
+        for curr_idx, curr_temp in enumerate(temperatures):
+            while stack and temperatures[stack[-1]] < curr_temp:
+                prev_idx = stack.pop()
+                answer[prev_idx] = curr_idx - prev_idx
+            stack.append(curr_idx)
+
+            if warmest is None or curr_temp > warmest:
+                warmest = curr_temp
+                records.append(lo + curr_idx)
+
+        out = shm_out.buf.cast('q')
+        out[lo:hi] = array('q', answer)
+        out.release()
+        return [lo + i for i in stack], records
+    finally:
+        shm_in.close()
+        shm_out.close()
+
+
+def dailyTemperaturesArray(temperatures: Sequence[int], workers: Optional[int] = None,
+                           chunks_per_worker: int = 4) -> array:
+    n = len(temperatures)
+    workers = workers or os.cpu_count() or 1
+    answer = array('q', bytes(8 * n))
+    if n == 0:
+        return answer
+
+    shm_in = shared_memory.SharedMemory(create=True, size=8 * n)
+    shm_out = shared_memory.SharedMemory(create=True, size=8 * n)
+    try:
+        view = shm_in.buf.cast('q')
+        view[:] = temperatures if isinstance(temperatures, array) else array('q', temperatures)
+        view.release()
+        shm_out.buf[:] = bytes(8 * n)
+
+        n_chunks = max(1, min(n, workers * chunks_per_worker))
+        bounds = [n * c // n_chunks for c in range(n_chunks + 1)]
+        tasks = [(shm_in.name, shm_out.name, bounds[c], bounds[c + 1]) for c in range(n_chunks)]
+
+        with Pool(workers) as pool:
+            results = pool.map(_solve_chunk, tasks)
+
+        answer = array('q')
+        answer.frombytes(shm_out.buf[: 8 * n])
+
+        # Merge pass: resolve boundary-pending days against LATER chunks
+        carried: List[int] = []
+        for pending, records in results:
+            for r in records:
+                r_temp = temperatures[r]
+                while carried and temperatures[carried[-1]] < r_temp:
+                    prev_idx = carried.pop()
+                    answer[prev_idx] = r - prev_idx
+            carried.extend(pending)
+    finally:
+        shm_in.close()
+        shm_in.unlink()
+        shm_out.close()
+        shm_out.unlink()
+
+    return answer
+
+
+def dailyTemperaturesParallel(temperatures: List[int], workers: Optional[int] = None) -> List[int]:
+    return dailyTemperaturesArray(temperatures, workers).tolist()
+
+
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from solve import Solution
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**7
+    random.seed(739)
+    temps = array('q', (random.randint(30, 100) for _ in range(n)))
+
+    start = time.perf_counter()
+    expected = Solution().dailyTemperatures(temps)
+    serial = time.perf_counter() - start
+    print(f"N = {n:,}")
+    print(f"serial      : {serial:7.2f} s")
+
+    cores = os.cpu_count() or 1
+    workers = 1
+    while workers <= cores:
+        start = time.perf_counter()
+        got = dailyTemperaturesArray(temps, workers)
+        elapsed = time.perf_counter() - start
+        assert got.tolist() == expected, "parallel result differs from serial"
+        print(f"{workers:>2} worker(s): {elapsed:7.2f} s  ({serial / elapsed:.2f}x)")
+        workers *= 2
@@ -0,0 +1,111 @@
+# ---------------------------------------------------------
+# 1. TRANSLATION & CONSTRAINTS
+#    Input:  An UNBOUNDED feed of temperatures, one reading or one batch at a time.
+#    Output: (index, wait) pairs, emitted the moment each answer is known.
+#    Goal:   Same answers as Solution.dailyTemperatures, without ever holding
+#            the whole input or the whole answer array.
+#
+# 2. BUDGET & BOUNDARIES
+#    N = unbounded.
+#    Time: O(1) amortized per reading (each index is pushed and popped once).
+#    Space: O(stack size) - only the days still waiting for a warmer one.
+#    Edge Cases:
+#       - Decreasing feed: nothing is emitted until flush() (stack keeps growing).
+#       - Increasing feed: every reading resolves the previous one immediately.
+#
+# 3. STRATEGY & BOTTLENECK
+#    Naive:   Buffer the feed, then call Solution.dailyTemperatures. O(N) memory,
+#             and no answer until the very end.
+#    Pivot:   In the batch version answer[prev_idx] is FINAL the moment it is
+#             written. Nothing stops us from handing it out right away.
+#    Tool:    The same decreasing monotonic stack, storing (index, temperature)
+#             because the temperatures list itself is no longer kept.
+#
+# 4. THE STATE MACHINE (The "Human" logic)
+#    - WHILE [current temp > temp at stack top]:
+#        1. Pop the waiting day.
+#        2. EMIT (popped_index, current_index - popped_index).
+#    - ALWAYS: push (current_index, current_temp).
+#    - flush(): EMIT (index, 0) for every day still waiting.
+# ---------------------------------------------------------
+
+from typing import Iterable, Iterator, List, Tuple
+
+
+class DailyTemperaturesStream:
+    def __init__(self):
+        self.next_idx = 0
+        self.idx_stack: List[int] = [] # indices still waiting for a warmer day
+        self.temp_stack: List[int] = [] # their temperatures (parallel to idx_stack)
+        self.undelivered: List[Tuple[int, int]] = [] # answers of a push_many that raised
+
+    def push(self, temp: int) -> List[Tuple[int, int]]:
+        curr_idx = self.next_idx
+        self.next_idx += 1
+
+        resolved = self._take_undelivered()
+        idx_stack, temp_stack = self.idx_stack, self.temp_stack
+        while temp_stack and temp_stack[-1] < temp:
+            temp_stack.pop()
+            prev_idx = idx_stack.pop()
+            resolved.append((prev_idx, curr_idx - prev_idx))
+
+        idx_stack.append(curr_idx)
+        temp_stack.append(temp)
+        return resolved
+
+    def push_many(self, temps: Iterable[int]) -> List[Tuple[int, int]]:
+        # Eager like push(): the whole batch is ingested before returning, so
+        # nothing is lost if the result is ignored and indices never repeat.
+        resolved = self._take_undelivered()
+        idx_stack, temp_stack = self.idx_stack, self.temp_stack
+        curr_idx = self.next_idx
+        try:
+            for temp in temps:
+                while temp_stack and temp_stack[-1] < temp:
+                    temp_stack.pop()
+                    prev_idx = idx_stack.pop()
+                    resolved.append((prev_idx, curr_idx - prev_idx))
+                idx_stack.append(curr_idx)
+                temp_stack.append(temp)
+                curr_idx += 1
+        except BaseException:
+            # The readings before the bad one are on the stack; their answers
+            # go out with the next push / push_many / flush instead.
+            self.undelivered = resolved
+            raise
+        finally:
+            self.next_idx = curr_idx
+        return resolved
+
+    def _take_undelivered(self) -> List[Tuple[int, int]]:
+        resolved, self.undelivered = self.undelivered, []
+        return resolved
+
+    def flush(self) -> List[Tuple[int, int]]:
+        # No warmer day arrived for these: the answer is 0. Oldest first.
+        pending = self._take_undelivered() + [(idx, 0) for idx in self.idx_stack]
+        self.idx_stack.clear()
+        self.temp_stack.clear()
+        return pending
+
+    @property
+    def pending(self) -> int:
+        return len(self.idx_stack)
+
+
+def dailyTemperaturesStream(temperatures: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    # One-shot helper: stream everything, then flush the leftovers
+    engine = DailyTemperaturesStream()
+    for temp in temperatures:
+        yield from engine.push(temp)
+    yield from engine.flush()
+
+# Time: O(1) amortized per reading.
+# Space: O(pending days) - the stack only, never the stream.
+
+if __name__ == "__main__":
+    engine = DailyTemperaturesStream()
+    print(f"Push 73, 74: {engine.push(73) + engine.push(74)} (Expected: [(0, 1)])")
+    print(f"Push batch : {engine.push_many([75, 71, 69, 72, 76, 73])}")
+    print(f"Flush      : {engine.flush()} (Expected: [(6, 0), (7, 0)])")
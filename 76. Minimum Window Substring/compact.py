@@ -0,0 +1,97 @@
+import os
+import sys
+import time
+from typing import Optional
+
+if __name__ == "__main__": # run as a script: make the repo root (and lc) importable
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lc.alphabet import compact
+from lc.profiling import WindowCounters
+
+
+def minWindow(s: str, t: str, counters: Optional[WindowCounters] = None) -> str:
+    # 1. INPUT/OUTPUT:
+    #    Same contract as Solution.minWindow, for any Unicode s and t.
+
+    # 2. FORMULA:
+    #    need[c] = (count of c in t) - (count of c in the window).
+    #    The window is desirable iff missing == sum of positive need == 0.
+
+    # 3. CONSTRAINTS & COMPLEXITY:
+    #    O(N) two pointers as before; each step is a list index instead of
+    #    two dict lookups and a membership test.
+
+    # 4. STRATEGY:
+    #    Remap the symbols of s and t to dense ids (lc.alphabet), so one
+    #    counter indexed by id replaces dict_t and window_counts.
+
+    if not t or not s:
+        return ""
+
+    timed = counters is not None
+    start = time.perf_counter() if timed else 0.0
+    alphabet = compact(s, t)
+    data = alphabet.encode(s)
+    need = alphabet.counter()
+    for c in alphabet.encode(t):
+        need[c] += 1
+    encoded = time.perf_counter() if timed else 0.0
+
+    missing = len(t)
+    best_len, best_l = len(s) + 1, 0
+    l = 0
+
+    for r, c in enumerate(data):
+        # Expand: c only helps if the window still lacks it
+        if need[c] > 0:
+            missing -= 1
+        need[c] -= 1
+
+        if missing == 0:
+            # Contract past every surplus symbol (need < 0 means "more than t asks")
+            while need[data[l]] < 0:
+                need[data[l]] += 1
+                l += 1
+
+            if r - l + 1 < best_len:
+                best_len, best_l = r - l + 1, l
+
+            # Give up s[l] so the window becomes undesirable and keeps moving
+            need[data[l]] += 1
+            missing += 1
+            l += 1
+
+    if timed:
+        # Every step of r is an expansion and every step of l a contraction
+        counters.add_time("encode", encoded - start)
+        counters.add_time("scan", time.perf_counter() - encoded)
+        counters.add("symbols", alphabet.size)
+        counters.add("expansions", len(data))
+        counters.add("contractions", l)
+
+    return "" if best_len > len(s) else s[best_l : best_l + best_len]
+
+
+if __name__ == "__main__":
+    import random
+
+    import lc
+
+    print(f"Test 1 Output: '{minWindow('ADOBECODEBANC', 'ABC')}' (Expected: 'BANC')")
+    print(f"Test 2 Output: '{minWindow('a', 'aa')}' (Expected: '')")
+    print(f"Test 3 Output: '{minWindow('ñandú y ÑANDÚ', 'Úú')}' (Expected: 'ú y ÑANDÚ')")
+
+    counters = WindowCounters()
+    minWindow("ADOBECODEBANC", "ABC", counters)
+    print(f"Test 4 Output: {counters.to_json()}")
+
+    solution = lc.get("76", "sliding_window")
+    random.seed(76)
+    n = 10**6
+    s = "".join(random.choices("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ", k=n))
+    t = "".join(random.choices("abcdefghijklmnopqrstuvwxyz", k=20))
+    for name, fn in (("Solution.minWindow (dicts)", solution), ("compact.minWindow (dense ids)", minWindow)):
+        start = time.perf_counter()
+        fn(s, t)
+        print(f"{name:<31} {time.perf_counter() - start:8.3f} s  (N = {n:,})")
@@ -1,5 +1,12 @@
+import time
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from lc.profiling import WindowCounters
+
+
 class Solution:
-    def minWindow(s: str, t: str) -> str:
+    def minWindow(s: str, t: str, counters: "Optional[WindowCounters]" = None) -> str:
         # 1. INPUT/OUTPUT:
         #    Input: Strings s and t, lengths up to 10^5.
         #    Output: String (Minimum window substring or "").
@@ -26,6 +33,7 @@ class Solution:
         for char in t:
             dict_t[char] = dict_t.get(char, 0) + 1
 
+        start = time.perf_counter() if counters is not None else 0.0
         required = len(dict_t)
         l, r = 0, 0
         
@@ -62,6 +70,12 @@ class Solution:
 
             # Keep expanding the window once we've done contracting.
             r += 1    
-            
+
+        if counters is not None:
+            # Profiling: every step of r is an expansion, every step of l a contraction
+            counters.add_time("scan", time.perf_counter() - start)
+            counters.add("expansions", r)
+            counters.add("contractions", l)
+
         return "" if ans[0] == float("inf") else s[ans[1] : ans[2] + 1]
         
\ No newline at end of file
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from heapq import merge
+from typing import Dict, List
+
+
+class MinWindowIndex:
+    """
+    Answers many minWindow(s, t) queries against ONE fixed document s.
+    """
+
+    # 1. INPUT/OUTPUT:
+    #    Input: A large document s (built once) and many short queries t.
+    #    Output: For each t, the same minimum window solve.py would return.
+
+    # 2. FORMULA:
+    #    A minimum window always starts and ends on a character of t, so the
+    #    characters of s that are NOT in t can never change the answer.
+
+    # 3. CONSTRAINTS & COMPLEXITY:
+    #    Build: O(m) once. Query: O(M log u) where M is the number of
+    #    occurrences in s of t's u distinct characters, independent of len(s).
+
+    # 4. STRATEGY:
+    #    Solution.minWindow rescans all of s per query: O(m) every time.
+    #    Bottleneck is walking over characters that cannot matter.
+    #    Optimize with per-character sorted position lists: merge only the
+    #    lists of t's characters and run the same two-pointer sweep over that
+    #    filtered sequence. Repeated queries hit an LRU cache.
+
+    def __init__(self, s: str, cache_size: int = 1024):
+        self.s = s
+        self.positions: Dict[str, List[int]] = {}
+        for i, char in enumerate(s):
+            self.positions.setdefault(char, []).append(i)
+
+        self.cache_size = cache_size
+        self.cache: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def minWindow(self, t: str) -> str:
+        if t in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(t)
+            return self.cache[t]
+
+        self.misses += 1
+        ans = self._query(t)
+        if self.cache_size > 0:
+            self.cache[t] = ans
+            if len(self.cache) > self.cache_size:
+                # Evict the least recently used query
+                self.cache.popitem(last=False)
+        return ans
+
+    def _query(self, t: str) -> str:
+        if not t or not self.s:
+            return ""
+
+        # Frequency requirement map
+        dict_t = {}
+        for char in t:
+            dict_t[char] = dict_t.get(char, 0) + 1
+
+        # Early exit: s simply does not have enough of some character
+        for char, need in dict_t.items():
+            if len(self.positions.get(char, ())) < need:
+                return ""
+
+        # Filtered view of s: (index, char) for t's characters only, in order
+        filtered = list(merge(*([(i, char) for i in self.positions[char]] for char in dict_t)))
+
+        required = len(dict_t)
+        formed = 0
+        window_counts = {}
+
+        # ans tuple of (window length, left, right) in s coordinates
+        ans = float("inf"), None, None
+        l = 0
+
+        for r in range(len(filtered)):
+            end, character = filtered[r]
+            window_counts[character] = window_counts.get(character, 0) + 1
+            if window_counts[character] == dict_t[character]:
+                formed += 1
+
+            # Contract from the left while the window still covers t
+            while formed == required:
+                start, character = filtered[l]
+                if end - start + 1 < ans[0]:
+                    ans = (end - start + 1, start, end)
+
+                window_counts[character] -= 1
+                if window_counts[character] < dict_t[character]:
+                    formed -= 1
+                l += 1
+
+        return "" if ans[0] == float("inf") else self.s[ans[1] : ans[2] + 1]
+
+
+if __name__ == "__main__":
+    index = MinWindowIndex("ADOBECODEBANC")
+    print(f"Test 1 Output: {index.minWindow('ABC')!r} (Expected: 'BANC')")
+    print(f"Test 2 Output: {index.minWindow('AAA')!r} (Expected: '')")
+    print(f"Test 3 Output: {index.minWindow('ABC')!r} (cache hits: {index.hits})")
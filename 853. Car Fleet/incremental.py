@@ -0,0 +1,116 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List
+
+
+class CarFleetTracker:
+    """
+    Keeps the car-fleet count up to date while cars join and leave one at a time.
+    """
+
+    # ---------------------------------------------------------
+    # 1. TRANSLATION & CONSTRAINTS
+    #    Input:  A stream of add(position, speed) / remove(position) events.
+    #    Output: The fleet count after every event.
+    #    Goal:   Never redo the full sorted(zip(position, speed)) pass.
+    #
+    # 2. BUDGET & BOUNDARIES
+    #    Time: O(log N) search + O(affected cars) per event (plus the list
+    #          memmove of insort, which is tiny in practice).
+    #    Space: O(N)
+    #    Edge Cases:
+    #       - Adding a car that catches the fleet ahead -> count unchanged.
+    #       - Adding a slow car -> it can swallow several fleets behind it.
+    #       - Removing a fleet leader -> the cars it was holding back may
+    #         split into new fleets.
+    #
+    # 3. STRATEGY & BOTTLENECK
+    #    Naive:   Call Solution.carFleet after every event. O(N log N) each time.
+    #    Pivot:   Reading cars from the target backwards, a car leads a fleet
+    #             exactly when its arrival time is STRICTLY greater than the
+    #             max arrival time of every car ahead of it. So the leaders
+    #             are the "record" cars, and their times strictly increase
+    #             as the position decreases. An event can only change the
+    #             records in one contiguous stretch behind the changed car.
+    #    Tool:    bisect-backed sorted arrays: every car's position, and the
+    #             positions of the fleet leaders only.
+    #
+    # 4. THE STATE MACHINE
+    #    - add(p): M = time of the nearest leader ahead of p.
+    #        If time(p) <= M: it merges. Nothing else changes.
+    #        Else: p leads. Leaders right behind it with time <= time(p) are
+    #              now stuck behind it, so they stop leading.
+    #    - remove(p): if p was not a leader, nothing changes.
+    #        Else: rescan only the cars between p and the next leader behind
+    #              it, starting from M = time of the leader ahead of p.
+    # ---------------------------------------------------------
+
+    def __init__(self, target: int):
+        self.target = target
+        self.positions: List[int] = [] # every car, ascending
+        self.time: Dict[int, float] = {} # position -> arrival time if alone
+        self.leaders: List[int] = [] # fleet leaders, ascending
+
+    def _time_ahead(self, p: int) -> float:
+        # Max arrival time of all cars strictly ahead of p = nearest leader ahead
+        i = bisect_right(self.leaders, p)
+        return self.time[self.leaders[i]] if i < len(self.leaders) else float("-inf")
+
+    def add(self, position: int, speed: int) -> int:
+        if position in self.time:
+            raise ValueError(f"a car is already at position {position}")
+
+        t = (self.target - position) / speed
+        insort(self.positions, position)
+        self.time[position] = t
+
+        if t > self._time_ahead(position):
+            # Swallow the leaders right behind that are not slower than us
+            hi = bisect_left(self.leaders, position)
+            lo = hi
+            while lo > 0 and self.time[self.leaders[lo - 1]] <= t:
+                lo -= 1
+            self.leaders[lo:hi] = [position]
+
+        return len(self.leaders)
+
+    def remove(self, position: int) -> int:
+        idx = bisect_left(self.positions, position)
+        if idx == len(self.positions) or self.positions[idx] != position:
+            raise KeyError(position)
+        del self.positions[idx]
+        del self.time[position]
+
+        li = bisect_left(self.leaders, position)
+        if li < len(self.leaders) and self.leaders[li] == position:
+            del self.leaders[li]
+
+            # Re-run the fleet logic only between the next leader behind and p
+            running = self._time_ahead(position)
+            stop = self.leaders[li - 1] if li > 0 else None
+            freed = []
+            for k in range(idx - 1, -1, -1):
+                q = self.positions[k]
+                if q == stop:
+                    break
+                if self.time[q] > running:
+                    running = self.time[q]
+                    freed.append(q)
+            self.leaders[li:li] = freed[::-1]
+
+        return len(self.leaders)
+
+    @property
+    def fleets(self) -> int:
+        return len(self.leaders)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+
+if __name__ == "__main__":
+    tracker = CarFleetTracker(12)
+    for p, s in zip([10, 8, 0, 5, 3], [2, 4, 1, 1, 3]):
+        count = tracker.add(p, s)
+    print(f"Test 1 Output: {count} (Expected: 3)")
+    print(f"Test 2 Output: {tracker.remove(5)} (Expected: 3)")
+    print(f"Test 3 Output: {tracker.remove(10)} (Expected: 3)")
@@ -0,0 +1,181 @@
+import heapq
+from fractions import Fraction
+from typing import Iterator, List, NamedTuple
+
+
+class MergeEvent(NamedTuple):
+    time: Fraction # exact moment the fleets touch
+    position: Fraction # where they touch (always <= target)
+    leader: int # car index leading the fleet ahead, which survives
+    absorbed: int # car index leading the fleet behind, which joins it
+    size: int # cars in the merged fleet
+
+
+class CarFleetSimulation:
+    """
+    Replays the road in time order, yielding every merge as it happens.
+    """
+
+    # ---------------------------------------------------------
+    # 1. TRANSLATION & CONSTRAINTS
+    #    Input:  target, position, speed (same as Solution.carFleet).
+    #    Output: A lazy stream of MergeEvent(time, position, leader, absorbed,
+    #            size), in time order, plus the members of any fleet on demand.
+    #    Goal:   Explain the count: WHEN and WHERE each merge happens, and who
+    #            ends up in which fleet.
+    #
+    # 2. BUDGET & BOUNDARIES
+    #    Time: O(N log N) sort, O(N) heapify, then O(log N) per event, so
+    #          stopping after the first K merges costs O(N log N + K log N).
+    #    Space: O(N)
+    #    Edge Cases:
+    #       - Catching up exactly AT the target still merges (as in carFleet).
+    #       - Several fleets meeting at one point at one time: each pairwise
+    #         merge is its own event, all with the same time.
+    #       - Times are Fractions, so near-ties are never decided by rounding.
+    #
+    # 3. STRATEGY & BOTTLENECK
+    #    Naive:   Advance every car by a small time step and look for overlaps.
+    #             Slow, and only as exact as the step.
+    #    Pivot:   A fleet always moves at the speed of its FRONT car, so its
+    #             front is at p + s * t from t = 0 until it is absorbed. Only
+    #             ADJACENT fleets can meet next, at
+    #             t = (p_ahead - p_behind) / (s_behind - s_ahead).
+    #    Tool:    A min-heap of candidate catch-up events between neighbours,
+    #             a doubly linked list of live fleets, and lazy deletion of
+    #             events whose fleets are no longer neighbours.
+    #
+    # 4. THE STATE MACHINE
+    #    - Pop the earliest event (t, behind, ahead).
+    #    - Skip it if `behind` is dead or `ahead` is no longer right in front.
+    #    - Else: unlink `behind`, splice its members after `ahead`'s, and
+    #      schedule the new neighbour pair (behind's old follower, ahead).
+    # ---------------------------------------------------------
+
+    def __init__(self, target: int, position: List[int], speed: List[int]):
+        self.target = target
+        self.position = position
+        self.speed = speed
+
+        # Fleets are named after their front car; order[k] is the k-th car
+        # from the target, and ahead / behind link the LIVE fleets.
+        order = sorted(range(len(position)), key=lambda i: position[i], reverse=True)
+        n = len(order)
+        self.ahead = [-1] * n
+        self.behind = [-1] * n
+        for a, b in zip(order, order[1:]):
+            self.behind[a] = b
+            self.ahead[b] = a
+        self.alive = [True] * n
+        self.front = order[0] if order else -1
+
+        # Members as linked lists (O(1) splice): first / last car of each fleet
+        self.next_member = [-1] * n
+        self.last_member = list(range(n))
+        self.size = [1] * n
+
+        self.heap = []
+        for a, b in zip(order, order[1:]):
+            self._schedule(b, a)
+        heapq.heapify(self.heap)
+
+    def _catch_up(self, behind: int, ahead: int):
+        # When does `behind` reach `ahead`, if before `ahead` finishes?
+        gap = self.position[ahead] - self.position[behind]
+        closing = self.speed[behind] - self.speed[ahead]
+        if closing <= 0:
+            return None
+        t = Fraction(gap, closing)
+        if self.position[ahead] + self.speed[ahead] * t > self.target:
+            return None
+        return t
+
+    def _schedule(self, behind: int, ahead: int) -> None:
+        t = self._catch_up(behind, ahead)
+        if t is not None:
+            self.heap.append((t, behind, ahead))
+
+    def events(self) -> Iterator[MergeEvent]:
+        heap = self.heap
+        while heap:
+            t, behind, ahead = heapq.heappop(heap)
+            if not self.alive[behind] or self.ahead[behind] != ahead:
+                continue # stale: one of them merged since this was scheduled
+
+            # Unlink `behind` from the road; its follower now trails `ahead`
+            follower = self.behind[behind]
+            self.behind[ahead] = follower
+            if follower >= 0:
+                self.ahead[follower] = ahead
+            self.alive[behind] = False
+
+            # Splice the members: ahead's cars first, then behind's
+            self.next_member[self.last_member[ahead]] = behind
+            self.last_member[ahead] = self.last_member[behind]
+            self.size[ahead] += self.size[behind]
+
+            if follower >= 0:
+                t_next = self._catch_up(follower, ahead)
+                if t_next is not None:
+                    heapq.heappush(heap, (t_next, follower, ahead))
+
+            yield MergeEvent(t, self.position[ahead] + self.speed[ahead] * t, ahead, behind, self.size[ahead])
+
+    def members(self, leader: int) -> List[int]:
+        """Car indices of the fleet led by `leader`, front to back."""
+        cars = []
+        car = leader
+        while car >= 0:
+            cars.append(car)
+            car = self.next_member[car]
+        return cars
+
+    def fleets(self) -> List[List[int]]:
+        """Current fleets, closest to the target first."""
+        result = []
+        fleet = self.front # the front car is never absorbed
+        while fleet >= 0:
+            result.append(self.members(fleet))
+            fleet = self.behind[fleet]
+        return result
+
+
+def carFleetEvents(target: int, position: List[int], speed: List[int]) -> Iterator[MergeEvent]:
+    return CarFleetSimulation(target, position, speed).events()
+
+
+if __name__ == "__main__":
+    import random
+    import time
+    from itertools import islice
+
+    from solve import Solution
+
+    # Test Case 1: at t = 1, car 1 catches car 0 at the target and car 4 catches car 3 at 6
+    sim = CarFleetSimulation(12, [10, 8, 0, 5, 3], [2, 4, 1, 1, 3])
+    events = list(sim.events())
+    print(f"Test 1 Output: {[(str(e.time), str(e.position), e.leader, e.absorbed) for e in events]} "
+          f"(Expected: [('1', '12', 0, 1), ('1', '6', 3, 4)])")
+    print(f"Test 2 Output: {sim.fleets()} (Expected: [[0, 1], [3, 4], [2]])")
+
+    # Test Case 3: car 0 catches car 1 at t = 1, then the pair catches car 2 at t = 2
+    sim = CarFleetSimulation(100, [0, 2, 4], [4, 2, 1])
+    print(f"Test 3 Output: {[(str(e.time), e.size) for e in sim.events()]} (Expected: [('1', 2), ('2', 3)])")
+
+    random.seed(853)
+    for n in (10**4, 10**5):
+        target = 10**6
+        position = random.sample(range(target), n)
+        speed = [random.randint(1, 10**3) for _ in range(n)]
+
+        start = time.perf_counter()
+        first = list(islice(carFleetEvents(target, position, speed), 10))
+        head = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sim = CarFleetSimulation(target, position, speed)
+        merges = sum(1 for _ in sim.events())
+        full = time.perf_counter() - start
+
+        assert n - merges == len(sim.fleets()) == Solution().carFleet(target, position, speed)
+        print(f"N = {n:>7,}: first 10 merges {head:7.3f} s, all {merges:,} merges {full:7.3f} s")
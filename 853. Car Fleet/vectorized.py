@@ -0,0 +1,137 @@
+from functools import cmp_to_key
+from typing import List
+
+import numpy as np
+
+
+def arrival_ranks(dist: np.ndarray, speed: np.ndarray) -> np.ndarray:
+    """
+    Dense integer rank of every arrival time dist[i] / speed[i], computed exactly.
+    Equal times get equal ranks.
+    """
+
+    # ---------------------------------------------------------
+    # Floats are only used to SORT. Division is monotonic, so the float
+    # order already agrees with the exact order, except inside runs of
+    # (nearly) equal floats. Those runs are re-sorted and split by exact
+    # integer cross-multiplication: a/b < c/d  <=>  a*d < c*b (b, d > 0).
+    # ---------------------------------------------------------
+    n = len(dist)
+    approx = dist / speed
+    order = np.argsort(approx)
+    sorted_approx = approx[order]
+
+    # close[i]: is sorted element i (nearly) tied with element i - 1?
+    close = np.zeros(n, dtype=bool)
+    close[1:] = (sorted_approx[1:] - sorted_approx[:-1]) <= 1e-12 * np.abs(sorted_approx[1:])
+    # gap[i]: is sorted element i strictly later than element i - 1?
+    gap = ~close
+
+    # Exact sign of time[k] - time[k - 1] for every close pair, vectorized
+    # while the cross products fit in int64, else left to Python ints.
+    tied = np.flatnonzero(close)
+    if int(np.abs(dist).max()) * int(speed.max()) < 2**62:
+        a, b = order[tied], order[tied - 1]
+        sign = np.sign(dist[a] * speed[b] - dist[b] * speed[a])
+        gap[tied] = sign > 0
+        misordered = tied[sign < 0]
+    else:
+        misordered = tied
+
+    def cross(i: int, j: int) -> int:
+        lhs = int(dist[i]) * int(speed[j])
+        rhs = int(dist[j]) * int(speed[i])
+        return (lhs > rhs) - (lhs < rhs)
+
+    # Only runs the float sort got wrong are re-sorted with Python ints
+    run_start = np.maximum.accumulate(np.where(close, 0, np.arange(n)))
+    next_start = np.append(np.flatnonzero(~close)[1:], n)
+    for lo in np.unique(run_start[misordered]).tolist():
+        hi = int(next_start[np.searchsorted(next_start, lo, side="right")])
+        order[lo:hi] = sorted(order[lo:hi].tolist(), key=cmp_to_key(cross))
+        for k in range(lo + 1, hi):
+            gap[k] = cross(order[k], order[k - 1]) > 0
+
+    ranks = np.empty(n, dtype=np.int64)
+    ranks[order] = np.cumsum(gap)
+    return ranks
+
+
+def carFleetNumpy(target: int, position: List[int], speed: List[int]) -> int:
+    """
+    Same answer as Solution.carFleet, with exact arrival-time comparisons.
+    """
+
+    # ---------------------------------------------------------
+    # 1. TRANSLATION & CONSTRAINTS
+    #    Input:  target, position, speed for N = 10^5 - 10^7 cars.
+    #    Output: Number of fleets.
+    #    Math:   A car (read from the target backwards) leads a new fleet iff
+    #            its arrival time is STRICTLY greater than the max arrival
+    #            time of every car ahead of it.
+    #
+    # 2. BUDGET & BOUNDARIES
+    #    Time: O(N log N) inside NumPy | Space: O(N)
+    #    Edge Cases:
+    #       - Two cars with the same arrival time: they merge. Floats can call
+    #         (target - p1) / s1 and (target - p2) / s2 unequal (or equal when
+    #         they are not) for huge inputs; integer ranks cannot.
+    #
+    # 3. STRATEGY & BOTTLENECK
+    #    Naive:   The stack loop in solve.py, one Python iteration per car.
+    #    Pivot:   "Pop when stack[-1] <= stack[-2]" is the same as comparing
+    #             each car to the running MAXIMUM of the cars ahead.
+    #    Tool:    argsort the positions once, rank the arrival times exactly
+    #             as integers, then np.maximum.accumulate over the ranks.
+    #
+    # 4. THE STATE MACHINE
+    #    - order = argsort(position) descending (closest to target first)
+    #    - r = ranks in that order
+    #    - ahead = running max of r, shifted by one
+    #    - return count(r > ahead)
+    # ---------------------------------------------------------
+    pos = np.asarray(position, dtype=np.int64)
+    spd = np.asarray(speed, dtype=np.int64)
+    if len(pos) == 0:
+        return 0
+
+    order = np.argsort(pos)[::-1]
+    ranks = arrival_ranks(target - pos, spd)[order]
+
+    ahead = np.empty_like(ranks)
+    ahead[0] = -1
+    np.maximum.accumulate(ranks[:-1], out=ahead[1:])
+    return int(np.count_nonzero(ranks > ahead))
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from solve import Solution
+
+    print(f"Test 1 Output: {carFleetNumpy(12, [10, 8, 0, 5, 3], [2, 4, 1, 1, 3])} (Expected: 3)")
+    # Float trap: arrival times 10^17 and 10^17 + 1 are the same float
+    big = 10**17
+    print(f"Test 2 Output: {carFleetNumpy(big + 1, [1, 0], [1, 1])} (Expected: 2, "
+          f"float stack says {Solution().carFleet(big + 1, [1, 0], [1, 1])})")
+
+    sizes = [int(a) for a in sys.argv[1:]] or [10**5, 10**6, 10**7]
+    rng = np.random.default_rng(853)
+    print(f"{'N':>10} {'stack (s)':>10} {'numpy (s)':>10} {'speedup':>8}")
+    for n in sizes:
+        target = 10 * n
+        position = rng.choice(target, size=n, replace=False)
+        speed = rng.integers(1, 100, size=n)
+
+        pos_list, spd_list = position.tolist(), speed.tolist()
+        start = time.perf_counter()
+        expected = Solution().carFleet(target, pos_list, spd_list)
+        stack_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        got = carFleetNumpy(target, position, speed)
+        numpy_secs = time.perf_counter() - start
+
+        assert got == expected
+        print(f"{n:>10,} {stack_secs:>10.3f} {numpy_secs:>10.3f} {stack_secs / numpy_secs:>7.1f}x")
@@ -0,0 +1,329 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  Every */solve.py and */solution*/solve.py in the repo.
+//    Output: Per problem and input shape: time, peak memory and a fitted
+//            complexity for every alternative solution, plus a cross-check
+//            that all alternatives return identical outputs.
+//    Goal:   Catch the day a "faster" variant turns out slower or wrong.
+//
+// 2. BUDGET & BOUNDARIES
+//    Sizes 10^2 .. 10^6 (--max-size), each variant gets a time budget per
+//    run (--budget): once it is exceeded, larger sizes are skipped for that
+//    variant (e.g. the O(N^2) replacement solution on all-openers input).
+//
+// 3. STRATEGY
+//    Tool: lc.load_path loads each solve.py by path (the directory names
+//          have spaces and dots), a PROBLEMS table says which callables are the
+//          variants and how to generate random + adversarial inputs.
+//    Complexity: least-squares slope of log(time) against log(N).
+//
+// 4. USAGE
+//    python benchmark.py                      # everything
+//    python benchmark.py 20 567 --max-size 100000
+//    python benchmark.py --save base.json     # record a baseline
+//    python benchmark.py --compare base.json  # exit 1 on a >1.5x regression
+// ---------------------------------------------------------
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from lc.registry import load_path
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+# ---------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------
+
+def discover() -> Dict[str, List[str]]:
+    """Problem id ("567") -> paths of every solve.py under that problem."""
+    found: Dict[str, List[str]] = {}
+    for entry in sorted(os.listdir(ROOT)):
+        problem_dir = os.path.join(ROOT, entry)
+        if not os.path.isdir(problem_dir) or not entry.split(".")[0].isdigit():
+            continue
+        paths = []
+        if os.path.isfile(os.path.join(problem_dir, "solve.py")):
+            paths.append(os.path.join(problem_dir, "solve.py"))
+        for sub in sorted(os.listdir(problem_dir)):
+            candidate = os.path.join(problem_dir, sub, "solve.py")
+            if sub.startswith("solution") and os.path.isfile(candidate):
+                paths.append(candidate)
+        if paths:
+            found[entry.split(".")[0]] = paths
+    return found
+
+
+# ---------------------------------------------------------
+# Problem table: variants + input shapes
+# ---------------------------------------------------------
+
+class Problem(NamedTuple):
+    variants: Callable[[Any], Dict[str, Callable]] # module -> {name: callable}
+    shapes: Dict[str, Callable[[int, random.Random], tuple]] # shape -> (n, rng) -> args
+
+
+def _functions(prefix: str, exact: bool = False) -> Callable[[Any], Dict[str, Callable]]:
+    # exact=True skips helpers that share the prefix but not the signature
+    # (e.g. checkInclusionStream next to the drop-in checkInclusion)
+    def pick(module) -> Dict[str, Callable]:
+        return {name: getattr(module, name) for name in vars(module)
+                if (name == prefix if exact else name.startswith(prefix))
+                and callable(getattr(module, name))
+                and getattr(getattr(module, name), "__module__", None) == module.__name__}
+    return pick
+
+
+def _method(cls: str, method: str, instance: bool = True) -> Callable[[Any], Dict[str, Callable]]:
+    def pick(module) -> Dict[str, Callable]:
+        owner = getattr(module, cls, None)
+        if owner is None or not hasattr(owner, method):
+            return {}
+        return {f"{cls}.{method}": getattr(owner() if instance else owner, method)}
+    return pick
+
+
+def _min_stack_ops(module) -> Dict[str, Callable]:
+    if not hasattr(module, "MinStack"):
+        return {}
+
+    def run(ops: List[Tuple[str, int]]) -> List[int]:
+        obj, out = module.MinStack(), []
+        for op, val in ops:
+            if op == "push":
+                obj.push(val)
+            elif op == "pop":
+                obj.pop()
+            else:
+                out.append(obj.getMin())
+        return out
+    return {"MinStack": run}
+
+
+def _brackets_random(n: int, rng: random.Random) -> tuple:
+    # Balanced random nesting of all three bracket types
+    out, stack = [], []
+    for i in range(n):
+        if stack and (rng.random() < 0.5 or len(stack) >= n - i):
+            out.append({"(": ")", "[": "]", "{": "}"}[stack.pop()])
+        else:
+            stack.append(rng.choice("([{"))
+            out.append(stack[-1])
+    return ("".join(out),)
+
+
+def _letters(alphabet: str) -> Callable[[int, random.Random], str]:
+    return lambda n, rng: "".join(rng.choices(alphabet, k=n))
+
+
+def _stack_ops(n: int, rng: random.Random) -> tuple:
+    ops, size = [], 0
+    for _ in range(n):
+        r = rng.random()
+        if size and r < 0.3:
+            ops.append(("pop", 0))
+            size -= 1
+        elif size and r < 0.5:
+            ops.append(("min", 0))
+        else:
+            ops.append(("push", rng.randint(-2**31, 2**31 - 1)))
+            size += 1
+    return (ops,)
+
+
+def _cars(n: int, rng: random.Random) -> tuple:
+    target = 10 * n
+    return target, rng.sample(range(target), n), [rng.randint(1, 100) for _ in range(n)]
+
+
+def _rpn(n: int, rng: random.Random) -> tuple:
+    tokens = [str(rng.randint(1, 100))]
+    while len(tokens) < n - 1:
+        tokens += [str(rng.randint(1, 100)), rng.choice("+-*")]
+    return (tokens,)
+
+
+PROBLEMS: Dict[str, Problem] = {
+    "20": Problem(_functions("isValid_"), {
+        "random": _brackets_random,
+        "all openers": lambda n, rng: ("(" * n,),
+        "deep nesting": lambda n, rng: ("(" * (n // 2) + ")" * (n // 2),),
+    }),
+    "424": Problem(_functions("characterReplacement", exact=True), {
+        "random": lambda n, rng: (_letters("ABCDEFGHIJKLMNOPQRSTUVWXYZ")(n, rng), 2),
+        "single repeated char": lambda n, rng: ("A" * n, 2),
+        "two letters": lambda n, rng: (_letters("AB")(n, rng), 5),
+    }),
+    "567": Problem(_functions("checkInclusion", exact=True), {
+        "random": lambda n, rng: (_letters("abcdefghijklmnopqrstuvwxyz")(8, rng),
+                                  _letters("abcdefghijklmnopqrstuvwxyz")(n, rng)),
+        "single repeated char": lambda n, rng: ("ab", "a" * n),
+        "match at end": lambda n, rng: ("abc", "a" * (n - 3) + "cba"),
+    }),
+    "739": Problem(_method("Solution", "dailyTemperatures"), {
+        "random": lambda n, rng: ([rng.randint(30, 100) for _ in range(n)],),
+        "sorted temperatures": lambda n, rng: (list(range(n)),),
+        "decreasing temperatures": lambda n, rng: (list(range(n, 0, -1)),),
+    }),
+    "853": Problem(_method("Solution", "carFleet"), {
+        "random": _cars,
+    }),
+    "76": Problem(_method("Solution", "minWindow", instance=False), {
+        "random": lambda n, rng: (_letters("ABCDEFGHIJ")(n, rng), "ABC"),
+        "single repeated char": lambda n, rng: ("A" * n, "AB"),
+    }),
+    "150": Problem(_method("Solution", "evalRPN"), {
+        "random": _rpn,
+    }),
+    "155": Problem(_min_stack_ops, {
+        "random": _stack_ops,
+        "sorted pushes": lambda n, rng: ([("push", i) for i in range(n)],),
+    }),
+}
+
+
+# ---------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------
+
+def measure(fn: Callable, args: tuple, n: int) -> Tuple[Any, float, int]:
+    repeats = max(1, min(5, 10**5 // max(n, 1)))
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def fit_complexity(points: List[Tuple[int, float]]) -> str:
+    # Slope of log(time) vs log(N); the smallest sizes are mostly call overhead
+    points = [(n, t) for n, t in points if n >= 1000 and t > 0]
+    if len(points) < 2:
+        return "?"
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+    if slope < 0.5:
+        label = "O(1)"
+    elif slope < 1.15:
+        label = "O(N)"
+    elif slope < 1.5:
+        label = "O(N log N)"
+    elif slope < 2.5:
+        label = "O(N^2)"
+    else:
+        label = "O(N^3+)"
+    return f"{label} (slope {slope:.2f})"
+
+
+def run_problem(pid: str, paths: List[str], sizes: List[int], budget: float) -> Dict[str, Any]:
+    problem = PROBLEMS[pid]
+    variants: Dict[str, Callable] = {}
+    for path in paths:
+        label = os.path.relpath(os.path.dirname(path), os.path.join(ROOT, os.path.relpath(path, ROOT).split(os.sep)[0]))
+        try:
+            module = load_path(path)
+        except Exception as exc: # a broken solve.py must not stop the suite
+            print(f"  ! cannot import {os.path.relpath(path, ROOT)}: {type(exc).__name__}: {exc}")
+            continue
+        for name, fn in problem.variants(module).items():
+            variants[name if label == "." else f"{label}/{name}"] = fn
+
+    report: Dict[str, Any] = {}
+    for shape, make in problem.shapes.items():
+        print(f"\n  [{shape}]")
+        print(f"  {'N':>9}  {'variant':<44} {'time':>11} {'peak mem':>11}")
+        timings: Dict[str, List[Tuple[int, float]]] = {v: [] for v in variants}
+        skipped = set()
+        for n in sizes:
+            args = make(n, random.Random(n))
+            outputs = {}
+            for name, fn in variants.items():
+                if name in skipped:
+                    continue
+                result, secs, peak = measure(fn, args, n)
+                outputs[name] = result
+                timings[name].append((n, secs))
+                report.setdefault(shape, {}).setdefault(name, {})[str(n)] = {"time": secs, "peak": peak}
+                print(f"  {n:>9,}  {name:<44} {secs * 1e3:>8.2f} ms {peak / 1024:>8.0f} KiB")
+                if secs > budget:
+                    skipped.add(name)
+            if len({repr(v) for v in outputs.values()}) > 1:
+                print(f"  !! MISMATCH at N={n:,}: " + ", ".join(f"{k}={v!r:.40}" for k, v in outputs.items()))
+                report.setdefault("mismatches", []).append({"shape": shape, "n": n})
+        for name, points in timings.items():
+            print(f"  {'fit':>9}  {name:<44} {fit_complexity(points)}")
+    return report
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    regressions = []
+    for pid, shapes in report.items():
+        for shape, variants in shapes.items():
+            if shape == "mismatches":
+                continue
+            for name, by_n in variants.items():
+                for n, now in by_n.items():
+                    before = baseline.get(pid, {}).get(shape, {}).get(name, {}).get(n)
+                    if before and now["time"] > tolerance * before["time"] and now["time"] > 1e-3:
+                        regressions.append(f"{pid} [{shape}] {name} N={n}: "
+                                           f"{before['time'] * 1e3:.2f} ms -> {now['time'] * 1e3:.2f} ms")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark and cross-check every solve.py")
+    parser.add_argument("problems", nargs="*", help="problem ids, e.g. 20 567 (default: all)")
+    parser.add_argument("--max-size", type=int, default=10**6)
+    parser.add_argument("--budget", type=float, default=2.0, help="seconds per run before larger N is skipped")
+    parser.add_argument("--save", help="write results as JSON")
+    parser.add_argument("--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    sizes = [10**e for e in range(2, 7) if 10**e <= args.max_size]
+    found = discover()
+    selected = args.problems or [pid for pid in found if pid in PROBLEMS]
+
+    report: Dict[str, Any] = {}
+    for pid in selected:
+        if pid not in PROBLEMS or pid not in found:
+            print(f"unknown problem {pid!r}")
+            continue
+        print(f"\n=== {pid}: {len(found[pid])} solve.py file(s)")
+        report[pid] = run_problem(pid, found[pid], sizes, args.budget)
+
+    status = 0
+    if any("mismatches" in r for r in report.values()):
+        status = 1
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        status = status or (1 if regressions else 0)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,13 @@
+"""
+Importable entry point for the solutions in this repo.
+
+    import lc
+    lc.get("567", "batch")(["ab", "ba"], "eidbaooo")
+    lc.variants("155")   # ['two_stacks', 'compact', 'locked', 'async', 'persistent']
+
+Nothing under the problem directories is executed until `get` asks for it.
+"""
+
+from lc.registry import REGISTRY, Entry, get, load_path, problems, variants
+
+__all__ = ["REGISTRY", "Entry", "get", "load_path", "problems", "variants"]
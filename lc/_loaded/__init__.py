@@ -0,0 +1,59 @@
+"""
+Namespace for the modules that lc.load_path executes.
+
+A worker started with "spawn" or "forkserver" unpickles a function as
+"lc._loaded.<sanitized path>.<name>" and imports that module from scratch.
+The finder below maps the name back to its file and runs it through
+load_path, so the worker sees exactly what the parent loaded.
+"""
+
+import importlib.abc
+import importlib.util
+import os
+import sys
+
+from lc.registry import REGISTRY, ROOT, load_path, module_name
+
+_PREFIX = __name__ + "."
+
+
+def _find_path(fullname: str):
+    # Registered files first, then any other .py file in the repo
+    for table in REGISTRY.values():
+        for entry in table.values():
+            if module_name(entry.path) == fullname:
+                return entry.path
+    for directory, dirs, files in os.walk(ROOT):
+        dirs[:] = [d for d in dirs if not d.startswith((".", "__"))]
+        for f in files:
+            if f.endswith(".py"):
+                path = os.path.join(directory, f)
+                if module_name(path) == fullname:
+                    return path
+    return None
+
+
+class _Loader(importlib.abc.Loader):
+    def __init__(self, path: str):
+        self.path = path
+
+    def create_module(self, spec):
+        # load_path executes the file (with its siblings importable) and caches it
+        return load_path(self.path)
+
+    def exec_module(self, module):
+        pass
+
+
+class _Finder(importlib.abc.MetaPathFinder):
+    def find_spec(self, fullname, path=None, target=None):
+        if not fullname.startswith(_PREFIX):
+            return None
+        file_path = _find_path(fullname)
+        if file_path is None:
+            return None
+        return importlib.util.spec_from_loader(fullname, _Loader(file_path), origin=file_path)
+
+
+if not any(isinstance(finder, _Finder) for finder in sys.meta_path):
+    sys.meta_path.append(_Finder())
@@ -0,0 +1,69 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  The texts a window algorithm is about to scan (any Unicode).
+//    Output: An Alphabet: observed symbols -> dense ids 0..size-1, an encoder,
+//            and the right kind of counter for that size.
+//    Goal:   Keep the speed of "ord(c) - ord('a')" + [0] * 26 without its
+//            assumption that every character is a lowercase ASCII letter.
+//
+// 2. BUDGET & BOUNDARIES
+//    Build: one set() pass per text (C speed).
+//    Encode: str.translate + encode("latin-1") when size <= 256 (C speed),
+//            otherwise one dict lookup per character.
+//    Edge Cases:
+//       - Uppercase / digits / emoji: just more symbols.
+//       - Huge alphabets (CJK text): counters switch to hash maps, because
+//         allocating or scanning a list per call would cost O(size).
+//
+// 3. STRATEGY
+//    Dense ids make a plain list a perfect counter: no hashing, no gaps.
+// ---------------------------------------------------------
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence, Union
+
+# Above this many symbols, counters become dicts instead of lists
+ARRAY_LIMIT = 1 << 12
+
+Counter = Union[List[int], Dict[int, int]]
+
+
+class Alphabet:
+    def __init__(self, symbols: Iterable[str]):
+        self.symbols = tuple(sorted(set(symbols)))
+        self.index: Dict[str, int] = {c: i for i, c in enumerate(self.symbols)}
+        self.size = len(self.symbols)
+        # str.translate table: code point -> dense id as a 1-char string
+        self._table = {ord(c): chr(i) for i, c in enumerate(self.symbols)} if self.size <= 256 else None
+
+    def encode(self, text: str) -> Sequence[int]:
+        """Dense ids for `text`: bytes for small alphabets, a list otherwise."""
+        if self._table is not None:
+            return text.translate(self._table).encode("latin-1")
+        index = self.index
+        return [index[c] for c in text]
+
+    def counter(self) -> Counter:
+        """Fixed-size array when the alphabet is small, hash map when it is large."""
+        if self.size <= ARRAY_LIMIT:
+            return [0] * self.size
+        return defaultdict(int)
+
+    def decode(self, ids: Iterable[int]) -> str:
+        symbols = self.symbols
+        return "".join(symbols[i] for i in ids)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"Alphabet(size={self.size})"
+
+
+def compact(*texts: str) -> Alphabet:
+    symbols = set()
+    for text in texts:
+        symbols.update(text)
+    return Alphabet(symbols)
@@ -0,0 +1,50 @@
+"""
+Import-time benchmark: python -m lc.bench_import
+
+Every measurement runs in a fresh interpreter, so nothing is cached from a
+previous one. Compares:
+  - bare "import lc" (registry only)
+  - "import lc" + first use of one algorithm
+  - eagerly loading every registered module (what a flat import would cost)
+"""
+
+import subprocess
+import sys
+
+from lc.registry import REGISTRY, ROOT
+
+SNIPPETS = {
+    "baseline (no import)": "pass",
+    "import lc": "import lc",
+    "lc.get('739')": "import lc; lc.get('739')",
+    "lc.get('567', 'batch')": "import lc; lc.get('567', 'batch')",
+    "eager: every module": (
+        "import lc\n"
+        "for problem, table in lc.REGISTRY.items():\n"
+        "    for entry in table.values():\n"
+        "        lc.load_path(entry.path)"
+    ),
+}
+
+TIMER = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "{code}\n"
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure(code: str, runs: int = 5) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", TIMER.format(code=code)],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+        best = min(best, float(out.stdout.strip().splitlines()[-1]))
+    return best
+
+
+if __name__ == "__main__":
+    modules = {entry.path for table in REGISTRY.values() for entry in table.values()}
+    print(f"{len(REGISTRY)} problems, {len(modules)} modules, python {sys.version.split()[0]}")
+    for label, code in SNIPPETS.items():
+        print(f"{label:<26} {measure(code) * 1e3:8.2f} ms")
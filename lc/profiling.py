@@ -0,0 +1,90 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  A WindowCounters passed as `counters=` to a window solver.
+//    Output: Per-phase operation counts and wall time, as a dict or JSON.
+//    Goal:   See where the time goes (expansions, contractions, count
+//            updates ...) and check the amortized O(N) claims on real input.
+//
+// 2. BUDGET & BOUNDARIES
+//    Zero overhead when disabled: one loop per solver, with no counting and
+//    no clock reads unless counters is passed. Pointer-like counts fall out
+//    of state the loop keeps anyway (r, l, max_freq). Counts that need every
+//    step (matches / mismatches updates) are recomputed after the scan by
+//    zero_transitions, so only a profiled call pays for them.
+//
+// 3. STRATEGY
+//    ops[name] += n for counts, seconds[name] += dt for phases.
+//    An optional callback(phase, seconds, counters) fires after each phase,
+//    e.g. to forward the numbers to a metrics system.
+// ---------------------------------------------------------
+"""
+
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, Mapping, Optional, Sequence, Tuple
+
+
+class WindowCounters:
+    def __init__(self, callback: Optional[Callable[[str, float, "WindowCounters"], None]] = None):
+        self.ops: Dict[str, int] = {}
+        self.seconds: Dict[str, float] = {}
+        self.callback = callback
+
+    def add(self, name: str, n: int = 1) -> None:
+        self.ops[name] = self.ops.get(name, 0) + n
+
+    def add_time(self, name: str, elapsed: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + elapsed
+        if self.callback is not None:
+            self.callback(name, elapsed, self)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator["WindowCounters"]:
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def reset(self) -> None:
+        self.ops.clear()
+        self.seconds.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ops": dict(self.ops),
+            "seconds": dict(self.seconds),
+            "total_seconds": sum(self.seconds.values()),
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def __repr__(self) -> str:
+        return f"WindowCounters(ops={self.ops}, seconds={self.seconds})"
+
+
+def slide_steps(data: Sequence[Hashable], n: int, start: int, stop: int) -> Iterator[Tuple[Hashable, int]]:
+    """(symbol, delta) count changes of a length-n window whose right end
+    takes data[start:stop]: each symbol enters with -1, and once the window
+    is full the one n places back leaves with +1 (diff = need - window)."""
+    for r in range(start, stop):
+        yield data[r], -1
+        if r >= n:
+            yield data[r - n], 1
+
+
+def zero_transitions(diff: Mapping[Hashable, int], steps: Iterable[Tuple[Hashable, int]]) -> int:
+    """Replay `steps` on a copy of `diff` and count those that move an entry
+    onto or off zero, i.e. the matches / mismatches updates of the scan."""
+    diff = Counter(diff)
+    updates = 0
+    for c, delta in steps:
+        before = diff[c]
+        diff[c] = before + delta
+        if before == 0 or before == -delta:
+            updates += 1
+    return updates
@@ -0,0 +1,169 @@
+"""
+// ---------------------------------------------------------
+// 1. TRANSLATION & CONSTRAINTS
+//    Input:  A problem id ("567") and optionally a variant name ("batch").
+//    Output: The implementation (function, bound method or class).
+//    Goal:   Make solutions importable even though they live in directories
+//            like "567. Permutation in String/solution2" (spaces and dots).
+//
+// 2. BUDGET & BOUNDARIES
+//    "import lc" must stay cheap: it may NOT execute any solve.py (some pull
+//    in NumPy, multiprocessing, asyncio ...).
+//    Each module is executed at most once, on first use.
+//
+// 3. STRATEGY
+//    Tool: a static REGISTRY table (problem -> variant -> file + attribute)
+//          and importlib.util.spec_from_file_location for the actual load.
+//    Sibling imports ("from solve import MinStack", "from compiled import
+//    ...") resolve against the module's own directory, and never leak a
+//    "solve" module from one problem into another.
+// ---------------------------------------------------------
+"""
+
+import importlib.util
+import os
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, NamedTuple, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Entry(NamedTuple):
+    path: str # relative to the repo root
+    attr: str # "func", "Class" or "Class.method"
+    bind: bool = False # instantiate Class before taking .method
+
+
+REGISTRY: Dict[str, Dict[str, Entry]] = {
+    "20": {
+        "stack": Entry("20. Valid Parentheses/solution1/solve.py", "isValid_Stack"),
+        "replacement": Entry("20. Valid Parentheses/solution2/solve.py", "isValid_Replacement"),
+        "pointer": Entry("20. Valid Parentheses/solution3/solve.py", "isValid_Pointer"),
+        "stream": Entry("20. Valid Parentheses/solution4/solve.py", "isValid_Stream"),
+        "stream_chunks": Entry("20. Valid Parentheses/solution4/solve.py", "validate_chunks"),
+        "stream_file": Entry("20. Valid Parentheses/solution4/solve.py", "validate_file"),
+        "stream_files": Entry("20. Valid Parentheses/solution4/solve.py", "validate_files"),
+    },
+    "76": {
+        "sliding_window": Entry("76. Minimum Window Substring/solve.py", "Solution.minWindow"),
+        "index": Entry("76. Minimum Window Substring/window_index.py", "MinWindowIndex"),
+        "compact": Entry("76. Minimum Window Substring/compact.py", "minWindow"),
+    },
+    "150": {
+        "stack": Entry("150. Evaluate Reverse Polish Notation/solve.py", "Solution.evalRPN", bind=True),
+        "compiled": Entry("150. Evaluate Reverse Polish Notation/compiled.py", "evalRPN"),
+        "compile": Entry("150. Evaluate Reverse Polish Notation/compiled.py", "compile_rpn"),
+        "evaluate": Entry("150. Evaluate Reverse Polish Notation/compiled.py", "evaluate"),
+        "columns": Entry("150. Evaluate Reverse Polish Notation/vectorized.py", "evalRPNColumns"),
+        "dag": Entry("150. Evaluate Reverse Polish Notation/dag.py", "RPNDag"),
+    },
+    "155": {
+        "two_stacks": Entry("155. Min Stack/solve.py", "MinStack"),
+        "compact": Entry("155. Min Stack/compact.py", "CompactMinStack"),
+        "locked": Entry("155. Min Stack/threadsafe.py", "LockedMinStack"),
+        "async": Entry("155. Min Stack/threadsafe.py", "AsyncMinStack"),
+        "persistent": Entry("155. Min Stack/persistent.py", "PersistentMinStack"),
+    },
+    "424": {
+        "sliding_window": Entry("424. Longest Repeating Character Replacement/solution1/solve.py", "characterReplacement"),
+        "binary_search": Entry("424. Longest Repeating Character Replacement/solution2/solve.py", "characterReplacement"),
+        "byte_array": Entry("424. Longest Repeating Character Replacement/solution3/solve.py", "characterReplacement"),
+        "byte_array_many": Entry("424. Longest Repeating Character Replacement/solution3/solve.py", "characterReplacementMany"),
+        "stream": Entry("424. Longest Repeating Character Replacement/solution4/solve.py", "CharacterReplacementStream"),
+        "stream_window": Entry("424. Longest Repeating Character Replacement/solution4/solve.py", "characterReplacementWindow"),
+        "compact": Entry("424. Longest Repeating Character Replacement/solution5/solve.py", "characterReplacement"),
+    },
+    "567": {
+        "counts": Entry("567. Permutation in String/solution1/solve.py", "checkInclusion"),
+        "matches": Entry("567. Permutation in String/solution2/solve.py", "checkInclusion"),
+        "stream": Entry("567. Permutation in String/solution3/solve.py", "checkInclusionStream"),
+        "stream_file": Entry("567. Permutation in String/solution3/solve.py", "checkInclusionFile"),
+        "batch": Entry("567. Permutation in String/solution4/solve.py", "checkInclusionBatch"),
+        "index": Entry("567. Permutation in String/solution4/solve.py", "PermutationIndex"),
+        "compact": Entry("567. Permutation in String/solution5/solve.py", "checkInclusion"),
+        "shared_windows": Entry("567. Permutation in String/solution6/solve.py", "checkInclusionMany"),
+    },
+    "739": {
+        "monotonic_stack": Entry("739. Daily Temperatures/solve.py", "Solution.dailyTemperatures", bind=True),
+        "stream": Entry("739. Daily Temperatures/stream.py", "DailyTemperaturesStream"),
+        "parallel": Entry("739. Daily Temperatures/parallel.py", "dailyTemperaturesParallel"),
+        "engine": Entry("739. Daily Temperatures/engine.py", "MonotonicEngine"),
+    },
+    "853": {
+        "stack": Entry("853. Car Fleet/solve.py", "Solution.carFleet", bind=True),
+        "incremental": Entry("853. Car Fleet/incremental.py", "CarFleetTracker"),
+        "numpy": Entry("853. Car Fleet/vectorized.py", "carFleetNumpy"),
+        "simulation": Entry("853. Car Fleet/simulation.py", "CarFleetSimulation"),
+        "events": Entry("853. Car Fleet/simulation.py", "carFleetEvents"),
+    },
+}
+
+_modules: Dict[str, ModuleType] = {}
+
+
+def module_name(path: str) -> str:
+    """The importable name ("lc._loaded.<sanitized path>") load_path gives a file."""
+    rel = os.path.relpath(os.path.normpath(os.path.join(ROOT, path)), ROOT)
+    return "lc._loaded." + "".join(c if c.isalnum() else "_" for c in rel[:-3])
+
+
+def load_path(path: str) -> ModuleType:
+    """Execute the file at `path` (absolute or repo-relative) once and cache it."""
+    path = os.path.normpath(os.path.join(ROOT, path))
+    if path in _modules:
+        return _modules[path]
+
+    name = module_name(path)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+
+    # Siblings are imported by bare name ("solve", "compiled"). Hide any
+    # same-named module from another problem while this one executes, and
+    # drop ours afterwards so the next problem gets its own.
+    directory = os.path.dirname(path)
+    siblings = {f[:-3] for f in os.listdir(directory) if f.endswith(".py")}
+    saved = {m: sys.modules.pop(m) for m in siblings if m in sys.modules}
+    sys.path.insert(0, directory)
+    # Registered under its own name so process pools can pickle its functions;
+    # lc._loaded resolves the name back to this file in a fresh interpreter
+    # (spawn / forkserver workers).
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    finally:
+        sys.path.remove(directory)
+        for m in siblings:
+            sys.modules.pop(m, None)
+        sys.modules.update(saved)
+
+    _modules[path] = module
+    return module
+
+
+def problems() -> List[str]:
+    return list(REGISTRY)
+
+
+def variants(problem: str) -> List[str]:
+    return list(REGISTRY[str(problem)])
+
+
+def get(problem: str, variant: Optional[str] = None) -> Any:
+    """
+    lc.get("567")            -> first registered variant
+    lc.get("567", "batch")   -> checkInclusionBatch
+    lc.get("739")            -> Solution().dailyTemperatures
+    """
+    table = REGISTRY[str(problem)]
+    entry = table[variant] if variant is not None else next(iter(table.values()))
+
+    obj: Any = load_path(entry.path)
+    owner, _, method = entry.attr.partition(".")
+    obj = getattr(obj, owner)
+    if method:
+        obj = getattr(obj() if entry.bind else obj, method)
+    return obj